@@ -3,61 +3,148 @@
 All methods are no-ops if pygame.mixer is unavailable or if audio files are missing.
 """
 import os
+import queue
+import threading
 
 import pygame
 
-_ASSET_DIR = os.path.join(
-    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "assets"
+_ASSET_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "assets")
 )
-_ASSET_DIR = os.path.normpath(_ASSET_DIR)
+_SOUND_DIR = os.path.join(_ASSET_DIR, "sounds")
+_MUSIC_DIR = os.path.join(_ASSET_DIR, "music")
+
+_SFX_EXTS = (".wav", ".ogg")
+_MUSIC_EXTS = (".ogg", ".wav", ".mp3")
+
+
+def _scan_assets(directory: str, exts: tuple[str, ...]) -> dict[str, str]:
+    """Map file stem -> path for files in *directory* with a known extension.
+
+    When a stem exists with several extensions, the earliest in *exts* wins.
+    """
+    if not os.path.isdir(directory):
+        return {}
+    found: dict[str, dict[str, str]] = {}
+    for filename in os.listdir(directory):
+        stem, ext = os.path.splitext(filename)
+        if ext in exts:
+            found.setdefault(stem, {})[ext] = os.path.join(directory, filename)
+    return {
+        stem: next(by_ext[ext] for ext in exts if ext in by_ext)
+        for stem, by_ext in found.items()
+    }
 
 
 class AudioManager:
+    @staticmethod
+    def pre_init(buffer: int = 4096, frequency: int = 44100) -> None:
+        """Configure the mixer before it is initialized.
+
+        A 4096-sample buffer adds roughly 90ms of latency at 44.1kHz, which is
+        unnoticeable for menu/combat SFX but avoids underruns (pops) and
+        stalls in the game loop when several sounds play at once.
+        """
+        pygame.mixer.pre_init(frequency=frequency, size=-16, channels=2, buffer=buffer)
+
     def __init__(self):
-        self._mixer_available = pygame.mixer.get_init() is not None
+        # Resolved on first playback by _ensure_mixer(); None means unchecked
+        self._mixer_available: bool | None = None
         self._sfx_cache: dict[str, pygame.mixer.Sound | None] = {}
+        self._sfx_lock = threading.Lock()
+        self._loader_q: queue.Queue[str] = queue.Queue()
+        self._loader_thread: threading.Thread | None = None
         self._current_music: str | None = None
         self._sfx_volume = 1.0
         self._music_volume = 1.0
 
+        # Resolve asset paths once so playback never touches the filesystem
+        self._sfx_paths = _scan_assets(_SOUND_DIR, _SFX_EXTS)
+        self._music_paths = _scan_assets(_MUSIC_DIR, _MUSIC_EXTS)
+
+    def _ensure_mixer(self) -> bool:
+        """Return whether the mixer is usable, initializing it on first use.
+
+        Initializing the mixer keeps an audio thread busy, so it is left
+        until something actually wants to make a sound.
+        """
+        if self._mixer_available is None:
+            if pygame.mixer.get_init() is None:
+                try:
+                    pygame.mixer.init()
+                except pygame.error:
+                    pass
+            self._mixer_available = pygame.mixer.get_init() is not None
+            if self._mixer_available:
+                # SFX are short — decode them all in the background so
+                # later plays don't stall the game loop
+                self.preload(list(self._sfx_paths))
+        return self._mixer_available
+
     # ------------------------------------------------------------------
     # SFX
     # ------------------------------------------------------------------
 
+    def preload(self, names: list[str]) -> None:
+        """Queue the named sound effects for decoding on the loader thread."""
+        if not self._ensure_mixer():
+            return
+        for name in names:
+            self._loader_q.put(name)
+        if self._loader_thread is None:
+            self._loader_thread = threading.Thread(
+                target=self._loader_loop, name="sfx-loader", daemon=True,
+            )
+            self._loader_thread.start()
+
+    def _loader_loop(self) -> None:
+        while True:
+            name = self._loader_q.get()
+            if name not in self._sfx_cache:
+                self._load_sfx(name)
+
+    def _load_sfx(self, name: str) -> pygame.mixer.Sound | None:
+        """Decode assets/sounds/{name} and cache the result (None if missing).
+
+        Safe to call from both the game loop and the loader thread; if both
+        race on the same name, the first cached Sound wins.
+        """
+        snd = None
+        path = self._sfx_paths.get(name)
+        if path is not None:
+            try:
+                snd = pygame.mixer.Sound(path)
+            except pygame.error:
+                snd = None
+        with self._sfx_lock:
+            if name in self._sfx_cache:
+                return self._sfx_cache[name]
+            if snd is not None:
+                snd.set_volume(self._sfx_volume)
+            # Cache None too so missing files aren't retried
+            self._sfx_cache[name] = snd
+        return snd
+
     def play_sfx(self, name: str) -> None:
         """Play a sound effect by name. Loads from assets/sounds/{name}.wav or .ogg."""
-        if not self._mixer_available:
+        if not self._ensure_mixer():
             return
 
         if name in self._sfx_cache:
             snd = self._sfx_cache[name]
-            if snd is not None:
-                snd.play()
-            return
-
-        # Try loading
-        sound_dir = os.path.join(_ASSET_DIR, "sounds")
-        for ext in (".wav", ".ogg"):
-            path = os.path.join(sound_dir, name + ext)
-            if os.path.isfile(path):
-                try:
-                    snd = pygame.mixer.Sound(path)
-                    snd.set_volume(self._sfx_volume)
-                    self._sfx_cache[name] = snd
-                    snd.play()
-                    return
-                except pygame.error:
-                    pass
-
-        # File not found — cache None so we don't retry
-        self._sfx_cache[name] = None
+        else:
+            # Not decoded by the loader yet — SFX are tiny, load it now
+            snd = self._load_sfx(name)
+        if snd is not None:
+            snd.play()
 
     def set_sfx_volume(self, volume: float) -> None:
         """Set SFX volume (0.0–1.0)."""
-        self._sfx_volume = max(0.0, min(1.0, volume))
-        for snd in self._sfx_cache.values():
-            if snd is not None:
-                snd.set_volume(self._sfx_volume)
+        with self._sfx_lock:
+            self._sfx_volume = max(0.0, min(1.0, volume))
+            for snd in self._sfx_cache.values():
+                if snd is not None:
+                    snd.set_volume(self._sfx_volume)
 
     # ------------------------------------------------------------------
     # Music
@@ -68,24 +155,22 @@ class AudioManager:
 
         Skips if the same track is already playing.
         """
-        if not self._mixer_available:
+        if not self._ensure_mixer():
             return
 
         if self._current_music == name:
             return
 
-        music_dir = os.path.join(_ASSET_DIR, "music")
-        for ext in (".ogg", ".wav", ".mp3"):
-            path = os.path.join(music_dir, name + ext)
-            if os.path.isfile(path):
-                try:
-                    pygame.mixer.music.load(path)
-                    pygame.mixer.music.set_volume(self._music_volume)
-                    pygame.mixer.music.play(loops)
-                    self._current_music = name
-                    return
-                except pygame.error:
-                    pass
+        path = self._music_paths.get(name)
+        if path is not None:
+            try:
+                pygame.mixer.music.load(path)
+                pygame.mixer.music.set_volume(self._music_volume)
+                pygame.mixer.music.play(loops)
+                self._current_music = name
+                return
+            except pygame.error:
+                pass
 
         # File not found — no-op
         self._current_music = None
@@ -5,18 +5,34 @@ class Camera:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self._half_w = screen_width // 2
+        self._half_h = screen_height // 2
         self.x = 0
         self.y = 0
+        # Largest scroll offsets that keep the view inside the map
+        self.max_x = 0
+        self.max_y = 0
 
-    def update(self, target_x, target_y, map_width_px, map_height_px):
-        """Center on target, clamped so we never show void beyond the map."""
-        self.x = target_x - self.screen_width // 2
-        self.y = target_y - self.screen_height // 2
+    def set_bounds(self, map_width_px, map_height_px):
+        """Set the map size the camera is clamped to (call on map load)."""
+        self.max_x = max(0, map_width_px - self.screen_width)
+        self.max_y = max(0, map_height_px - self.screen_height)
 
-        # Clamp to map edges
-        self.x = max(0, min(self.x, map_width_px - self.screen_width))
-        self.y = max(0, min(self.y, map_height_px - self.screen_height))
+    def update(self, target_x, target_y):
+        """Center on target, clamped so we never show void beyond the map."""
+        x = target_x - self._half_w
+        y = target_y - self._half_h
+        self.x = 0 if x < 0 else (self.max_x if x > self.max_x else x)
+        self.y = 0 if y < 0 else (self.max_y if y > self.max_y else y)
 
     def apply(self, rect):
         """Offset a world-space rect into screen-space."""
         return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
+
+    def apply_pos(self, world_x, world_y):
+        """Offset a world-space point into screen-space.
+
+        Allocation-free alternative to apply() for blits, which only need
+        the top-left corner.
+        """
+        return (world_x - self.x, world_y - self.y)
@@ -1,15 +1,19 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from bit_flippers.sprites import AnimatedSprite, create_placeholder_enemy, load_player, load_enemy
+if TYPE_CHECKING:
+    from bit_flippers.sprites import AnimatedSprite
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffect:
     name: str
     turns_remaining: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatEntity:
     name: str
     hp: int
@@ -23,7 +27,7 @@ class CombatEntity:
         return self.hp > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyData:
     name: str
     hp: int
@@ -36,6 +40,11 @@ class EnemyData:
     ability: dict | None = None
     battle_sprite_key: str | None = None
     drop_item: str | None = None
+    sprite_key: str = field(init=False, default="")
+
+    def __post_init__(self):
+        # Asset key for enemy_{key}.png, e.g. "Scrap Rat" -> "scrap_rat"
+        self.sprite_key = self.name.lower().replace(" ", "_")
 
 
 ENEMY_TYPES: dict[str, EnemyData] = {
@@ -67,15 +76,27 @@ ENEMY_TYPES: dict[str, EnemyData] = {
     "Omega Core": EnemyData(name="Omega Core", hp=150, attack=22, defense=10, color=(255, 60, 60), xp_reward=200, money_reward=150, dexterity=8, ability={"name": "System Purge", "status_effect": "Stun", "chance": 0.40}, drop_item="Omega Core Matrix"),
 }
 
+# Registry order is fixed at import, so enemies can also be addressed by index
+ENEMY_LIST: tuple[EnemyData, ...] = tuple(ENEMY_TYPES.values())
+ENEMY_ID: dict[str, int] = {d.name: i for i, d in enumerate(ENEMY_LIST)}
+
+
+def get_enemy(id_or_name: int | str) -> EnemyData:
+    """Look up an enemy template by ENEMY_ID index or display name."""
+    if isinstance(id_or_name, int):
+        return ENEMY_LIST[id_or_name]
+    return ENEMY_TYPES[id_or_name]
+
 
 def create_enemy_combatant(enemy_data: EnemyData) -> CombatEntity:
     """Create a CombatEntity from an EnemyData template."""
-    key = enemy_data.name.lower().replace(" ", "_")
+    from bit_flippers.sprites import load_enemy
+
     return CombatEntity(
         name=enemy_data.name,
         hp=enemy_data.hp,
         max_hp=enemy_data.hp,
         attack=enemy_data.attack,
         defense=enemy_data.defense,
-        sprite=load_enemy(key, enemy_data.color, enemy_data.battle_sprite_key),
+        sprite=load_enemy(enemy_data.sprite_key, enemy_data.color, enemy_data.battle_sprite_key),
     )
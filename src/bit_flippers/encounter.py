@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 
-from bit_flippers.combat import EnemyData, ENEMY_TYPES
+from bit_flippers.combat import EnemyData, get_enemy
 from bit_flippers.settings import MIN_STEPS_BETWEEN_ENCOUNTERS
 
 
@@ -13,12 +13,13 @@ class EncounterManager:
 
     def __init__(self) -> None:
         self.steps_since_encounter: int = 0
-        self._encounter_table: list[str] = []
+        self._encounter_pool: tuple[EnemyData, ...] = ()
         self._encounter_chance: float = 0.0
 
     def configure(self, encounter_table: list[str], encounter_chance: float) -> None:
         """Set the encounter table and chance for the current map."""
-        self._encounter_table = encounter_table
+        # Resolve names once per map so rolls don't hash display names
+        self._encounter_pool = tuple(get_enemy(name) for name in encounter_table)
         self._encounter_chance = encounter_chance
 
     def on_step(self) -> EnemyData | None:
@@ -28,12 +29,12 @@ class EncounterManager:
         """
         self.steps_since_encounter += 1
         if (
-            self._encounter_table
+            self._encounter_pool
             and self.steps_since_encounter >= MIN_STEPS_BETWEEN_ENCOUNTERS
             and random.random() < self._encounter_chance
         ):
             self.steps_since_encounter = 0
-            return ENEMY_TYPES[random.choice(self._encounter_table)]
+            return random.choice(self._encounter_pool)
         return None
 
     def reset(self) -> None:
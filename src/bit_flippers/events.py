@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TileEvent:
     """A single event placed on a map tile."""
     x: int
@@ -24,9 +24,11 @@ _STEP_TYPES = frozenset({"trap", "damage_zone", "teleport", "heal_zone", "gate"}
 _INTERACT_TYPES = frozenset({"chest", "sign", "custom", "switch", "scrap_reward"})
 # Event types that can be either step or interact
 _FLEXIBLE_TYPES = frozenset({"spawn_combat"})
+# Event types that resolve to a "damage" action
+_DAMAGE_TYPES = frozenset({"trap", "damage_zone"})
 
 
-@dataclass
+@dataclass(slots=True)
 class EventAction:
     """Describes what the overworld should do in response to an event."""
     action_type: str  # "dialogue", "give_item", "damage", "teleport",
@@ -51,19 +53,28 @@ class EventManager:
 
     def __init__(self):
         self.events: list[TileEvent] = []
+        # (x, y) -> events on that tile, in map order
+        self.events_by_pos: dict[tuple[int, int], list[TileEvent]] = {}
         self.triggered: set[tuple[int, int]] = set()
 
     def load_events(self, tiled_renderer) -> None:
         """Parse Event objects from a TiledMapRenderer."""
         self.events = tiled_renderer.get_events()
+        self.events_by_pos = {}
+        for ev in self.events:
+            self.events_by_pos.setdefault((ev.x, ev.y), []).append(ev)
         # Don't reset triggered — caller restores from persistence
 
     def _find_event(self, x: int, y: int) -> TileEvent | None:
         """Find an untriggered event at (x, y)."""
-        for ev in self.events:
-            if ev.x == x and ev.y == y:
-                if ev.once and (x, y) in self.triggered:
-                    continue
+        tile_events = self.events_by_pos.get((x, y))
+        if tile_events is None:
+            return None
+        # Only tiles that have events reach the triggered-set probe, once
+        if (x, y) not in self.triggered:
+            return tile_events[0]
+        for ev in tile_events:
+            if not ev.once:
                 return ev
         return None
 
@@ -172,7 +183,7 @@ class EventManager:
                 )
             return None
 
-        if event.event_type in ("trap", "damage_zone"):
+        if event.event_type in _DAMAGE_TYPES:
             damage = int(props.get("damage", 1))
             msg = props.get("message", f"Took {damage} damage!")
             return EventAction(
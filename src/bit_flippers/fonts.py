@@ -1,5 +1,6 @@
 """Centralized font loading with pixel font + fallback."""
 import os
+from collections import OrderedDict
 
 import pygame
 
@@ -9,6 +10,9 @@ _FONT_PATH = os.path.join(
 _HAS_PIXEL_FONT = os.path.isfile(_FONT_PATH)
 _cache: dict[int, pygame.font.Font] = {}
 
+_TEXT_CACHE_MAX = 256
+_text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
 
 def get_font(size: int) -> pygame.font.Font:
     """Load a font at the given size, using pixel.ttf if available."""
@@ -20,3 +24,22 @@ def get_font(size: int) -> pygame.font.Font:
         font = pygame.font.SysFont(None, size)
     _cache[size] = font
     return font
+
+
+def render_text(size: int, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """Render *text* with get_font(size), reusing surfaces across frames.
+
+    HUD labels like "12/30" rarely change between frames, so the rendered
+    surface is kept in a small LRU cache instead of rasterizing it again.
+    Callers must not draw onto the returned surface.
+    """
+    key = (size, text, tuple(color), antialias)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+    surf = get_font(size).render(text, antialias, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > _TEXT_CACHE_MAX:
+        _text_cache.popitem(last=False)
+    return surf
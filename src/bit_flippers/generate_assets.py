@@ -1,4 +1,5 @@
 """Thin wrapper so asset generation can be invoked via `uv run generate-assets`."""
+import importlib.util
 import runpy
 import os
 import sys
@@ -9,6 +10,14 @@ def main():
         os.path.dirname(__file__), os.pardir, os.pardir, "tools", "generate_assets.py"
     )
     script = os.path.normpath(script)
-    # runpy executes the script as __main__
     sys.argv = [script]
-    runpy.run_path(script, run_name="__main__")
+    # Import the script as a module so its bytecode is cached in __pycache__,
+    # then call its main() directly
+    spec = importlib.util.spec_from_file_location("_bit_flippers_asset_tool", script)
+    if spec is None or spec.loader is None:
+        # Fall back to executing the script as __main__
+        runpy.run_path(script, run_name="__main__")
+        return
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.main()
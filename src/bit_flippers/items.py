@@ -1,7 +1,8 @@
+from collections import Counter
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: str
     description: str
@@ -153,6 +154,11 @@ ITEM_REGISTRY: dict[str, Item] = {
     ),
 }
 
+# Names of all consumable items (combat item menu filter)
+_CONSUMABLE_NAMES: frozenset[str] = frozenset(
+    name for name, item in ITEM_REGISTRY.items() if item.item_type == "consumable"
+)
+
 # Items available in the default shop (unlimited stock)
 SHOP_STOCK: list[str] = ["Repair Kit", "Voltage Spike", "Iron Plating", "Antidote Kit", "Scrap Metal"]
 
@@ -175,6 +181,28 @@ class Equipment:
 
     def __init__(self):
         self.slots: dict[str, str | None] = {s: None for s in self.SLOTS}
+        # Resolved Item for each occupied slot, so registry lookups happen once
+        self._slot_items: dict[str, Item] = {}
+        # Running sum of stat bonuses, kept in step with equip/unequip
+        self._bonuses: dict[str, int] = {}
+
+    def _apply_bonuses(self, item: Item | None, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an item's stat bonuses from the totals."""
+        if item is None:
+            return
+        for stat, val in item.stat_bonuses.items():
+            total = self._bonuses.get(stat, 0) + sign * val
+            if total:
+                self._bonuses[stat] = total
+            else:
+                self._bonuses.pop(stat, None)
+
+    def _set_slot(self, slot: str, item_name: str | None, item: Item | None) -> None:
+        self._apply_bonuses(self._slot_items.pop(slot, None), -1)
+        self.slots[slot] = item_name
+        if item is not None:
+            self._slot_items[slot] = item
+            self._apply_bonuses(item, 1)
 
     def equip(self, item_name: str) -> str | None:
         """Equip an item. Returns the previously equipped item name (or None)."""
@@ -182,30 +210,30 @@ class Equipment:
         if not item or item.item_type != "equipment" or not item.slot:
             return None
         previous = self.slots.get(item.slot)
-        self.slots[item.slot] = item_name
+        self._set_slot(item.slot, item_name, item)
         return previous
 
     def unequip(self, slot: str) -> str | None:
         """Unequip the item in a slot. Returns the removed item name (or None)."""
         previous = self.slots.get(slot)
         if slot in self.slots:
-            self.slots[slot] = None
+            self._set_slot(slot, None, None)
         return previous
 
+    def get_item(self, slot: str) -> Item | None:
+        """Return the Item equipped in *slot*, or None."""
+        return self._slot_items.get(slot)
+
     def is_equipped(self, item_name: str) -> bool:
         return item_name in self.slots.values()
 
     def get_total_bonuses(self) -> dict[str, int]:
         """Sum stat bonuses from all equipped items."""
-        totals: dict[str, int] = {}
-        for item_name in self.slots.values():
-            if item_name is None:
-                continue
-            item = ITEM_REGISTRY.get(item_name)
-            if item:
-                for stat, val in item.stat_bonuses.items():
-                    totals[stat] = totals.get(stat, 0) + val
-        return totals
+        return dict(self._bonuses)
+
+    def get_bonus(self, stat: str) -> int:
+        """Return the summed bonus for a single stat without copying the totals."""
+        return self._bonuses.get(stat, 0)
 
     def to_dict(self) -> dict[str, str | None]:
         return dict(self.slots)
@@ -214,35 +242,41 @@ class Equipment:
     def from_dict(cls, data: dict[str, str | None]) -> "Equipment":
         eq = cls()
         for slot in cls.SLOTS:
-            eq.slots[slot] = data.get(slot)
+            item_name = data.get(slot)
+            eq._set_slot(slot, item_name, ITEM_REGISTRY.get(item_name) if item_name else None)
         return eq
 
 
 class Inventory:
     def __init__(self):
-        self.items: dict[str, int] = {}
+        # Counter returns 0 for missing names, so reads never need a default
+        self.items: Counter[str] = Counter()
 
     def add(self, item_name: str, count: int = 1):
-        self.items[item_name] = self.items.get(item_name, 0) + count
+        self.items[item_name] += count
 
     def remove(self, item_name: str, count: int = 1):
         if item_name in self.items:
-            self.items[item_name] -= count
-            if self.items[item_name] <= 0:
+            remaining = self.items[item_name] - count
+            if remaining <= 0:
                 del self.items[item_name]
+            else:
+                self.items[item_name] = remaining
 
     def has(self, item_name: str) -> bool:
-        return self.items.get(item_name, 0) > 0
+        return self.items[item_name] > 0
 
     def get_count(self, item_name: str) -> int:
-        return self.items.get(item_name, 0)
+        return self.items[item_name]
+
+    def get_counts(self, item_names) -> list[int]:
+        """Counts for several items at once, aligned with *item_names*."""
+        items = self.items
+        return [items[name] for name in item_names]
 
     def get_consumables(self) -> list[str]:
-        result = []
-        for name, count in self.items.items():
-            if count > 0 and name in ITEM_REGISTRY and ITEM_REGISTRY[name].item_type == "consumable":
-                result.append(name)
-        return result
+        return [name for name, count in self.items.items()
+                if count > 0 and name in _CONSUMABLE_NAMES]
 
     def to_dict(self) -> dict[str, int]:
         return dict(self.items)
@@ -250,5 +284,5 @@ class Inventory:
     @classmethod
     def from_dict(cls, data: dict[str, int]) -> "Inventory":
         inv = cls()
-        inv.items = dict(data)
+        inv.items = Counter(data)
         return inv
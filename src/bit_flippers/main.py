@@ -1,15 +1,59 @@
+import time
+
 import pygame
-from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, COLOR_BLACK
+from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_DT, COLOR_BLACK
 from bit_flippers.audio import AudioManager
-from bit_flippers.save import load_config
+from bit_flippers.save import flush_saves, load_config
+from bit_flippers.sprites import make_surface
 from bit_flippers.states.title_screen import TitleScreenState
 
+# Cap on steps per frame so a long stall doesn't snowball into more stalls
+_MAX_SIM_STEPS = 5
+
+# Called every frame; bound once to skip the module attribute lookups
+_event_get = pygame.event.get
+_display_flip = pygame.display.flip
+_QUIT = pygame.QUIT
+
+
+def _refresh_rate() -> int:
+    """Refresh rate of the current display in Hz, or 0 if unknown."""
+    try:
+        return pygame.display.get_current_refresh_rate()
+    except (AttributeError, pygame.error):
+        return 0
+
 
 class Game:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # SCALED lets SDL scale the window on the GPU; vsync isn't available
+        # with every driver, so fall back to a plain window if refused
+        flags = pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags, vsync=1)
+            vsync = True
+        except pygame.error:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+            vsync = False
+        # With vsync, flip() already blocks on the display's refresh; a
+        # perf_counter deadline on top would drift against it and drop
+        # frames. Only keep the pacer as a cap on high-refresh displays.
+        self._pace_frames = not vsync or _refresh_rate() > FPS * 1.5
         pygame.display.set_caption("Bit Flippers")
-        self.clock = pygame.time.Clock()
+        # Every state is keyboard-driven; keep high-rate motion events out of
+        # the queue entirely so they never reach the Python event loop
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.JOYAXISMOTION,
+            pygame.JOYBALLMOTION,
+            pygame.JOYHATMOTION,
+            pygame.CONTROLLERAXISMOTION,
+            pygame.FINGERMOTION,
+        ])
+        self._frame_time = 1.0 / FPS
+        self._last_frame = time.perf_counter()
+        self._next_frame = self._last_frame + self._frame_time
+        self._accum = 0.0
         self.running = True
         self.audio = AudioManager()
 
@@ -22,47 +66,143 @@ class Game:
 
         self.state_stack: list = []
         self.state_stack.append(TitleScreenState(self))
+        # Top of state_stack, kept in step by push_state/pop_state
+        self.active_state = self.state_stack[-1]
 
-    @property
-    def active_state(self):
-        return self.state_stack[-1]
+        # States below the active one don't update, so their drawing is
+        # cached here and only redone when the stack below changes or a
+        # state asks for it via invalidate_layers()
+        self._underlay: pygame.Surface | None = None
+        self._underlay_key: tuple = ()
 
     def push_state(self, state):
         self.state_stack.append(state)
+        self.active_state = state
 
     def pop_state(self):
         if len(self.state_stack) > 1:
             self.state_stack.pop()
+            self.active_state = self.state_stack[-1]
 
     def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in _event_get():
+            if event.type == _QUIT:
                 self.running = False
                 return
+            # Re-read per event: a handler may push or pop states
             self.active_state.handle_event(event)
+            # Input to an overlay may change what is drawn beneath it
+            self.invalidate_layers()
 
     def update(self, dt):
         self.active_state.update(dt)
 
-    def draw(self):
-        self.screen.fill(COLOR_BLACK)
+    def invalidate_layers(self):
+        """Force the states beneath the active one to be redrawn next frame."""
+        self._underlay_key = ()
+
+    def draw(self, alpha=1.0):
+        """Draw the state stack and present it.
+
+        *alpha* is how far the frame lies between the last two simulation
+        steps (0..1); states with ``interpolated = True`` receive it so
+        moving things are drawn between their previous and current positions.
+        """
+        top = self.active_state
+        if len(self.state_stack) == 1 or getattr(top, "opaque", False):
+            # Nothing beneath the active state can show through
+            if not getattr(top, "opaque", False):
+                self.screen.fill(COLOR_BLACK)
+            self._draw_top(top, alpha)
+            _display_flip()
+            return
+
         # Draw all states in order so overlays (dialogue, combat) render on top
-        for state in self.state_stack:
-            state.draw(self.screen)
-        pygame.display.flip()
+        below = self.state_stack[:-1]
+        key = tuple(below)
+        if key != self._underlay_key:
+            if self._underlay is None:
+                self._underlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            if not getattr(below[0], "opaque", False):
+                self._underlay.fill(COLOR_BLACK)
+            for state in below:
+                state.draw(self._underlay)
+            self._underlay_key = key
+        self.screen.blit(self._underlay, (0, 0))
+        self._draw_top(top, alpha)
+        _display_flip()
+
+    def _draw_top(self, top, alpha):
+        if getattr(top, "interpolated", False):
+            top.draw(self.screen, alpha)
+        else:
+            top.draw(self.screen)
+
+    def _wait_next_frame(self):
+        """Block until the next frame deadline and return the elapsed dt.
+
+        Sleeps for most of the wait and spins the last millisecond, since
+        OS sleep granularity makes Clock.tick() jitter and overshoot.
+        When vsync paces the loop, this only measures dt.
+        """
+        if not self._pace_frames:
+            now = time.perf_counter()
+            dt = now - self._last_frame
+            self._last_frame = now
+            return dt
+        remaining = self._next_frame - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        while time.perf_counter() < self._next_frame:
+            pass
+        now = time.perf_counter()
+        self._next_frame += self._frame_time
+        if self._next_frame < now:
+            # Fell more than a frame behind — don't try to catch up in a burst
+            self._next_frame = now + self._frame_time
+        dt = now - self._last_frame
+        self._last_frame = now
+        return dt
+
+    def _step(self, dt):
+        """Advance the simulation by zero or more fixed SIM_DT steps.
+
+        The remainder stays in the accumulator; draw() gets it as the
+        interpolation alpha.
+        """
+        self._accum += dt
+        steps = 0
+        while self._accum >= SIM_DT and steps < _MAX_SIM_STEPS:
+            self.update(SIM_DT)
+            self._accum -= SIM_DT
+            steps += 1
+        if steps == _MAX_SIM_STEPS:
+            # Too far behind to catch up — drop the backlog
+            self._accum = 0.0
 
     def run(self):
+        # Poll input, simulate and present back to back, then wait out the
+        # rest of the frame; the first frame runs with dt=0 instead of
+        # absorbing start-up time
+        dt = 0.0
+        self._last_frame = time.perf_counter()
+        self._next_frame = self._last_frame + self._frame_time
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            self._step(dt)
+            self.draw(self._accum / SIM_DT)
+            dt = self._wait_next_frame()
 
 
 def main():
-    pygame.init()
+    # Only what the first frame needs; the mixer is started by AudioManager
+    # on first playback, using the pre_init() settings
+    AudioManager.pre_init()
+    pygame.display.init()
+    pygame.font.init()
     game = Game()
     game.run()
+    flush_saves()
     pygame.quit()
 
 
@@ -1,8 +1,10 @@
 """Map definitions and registry for multi-map navigation."""
 from dataclasses import dataclass, field
 
+import pygame
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DoorDef:
     """A door on this map linking to another map."""
     x: int
@@ -16,7 +18,7 @@ class DoorDef:
     locked_message: str = "The way is blocked."
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NPCDef:
     """Placement data for a friendly NPC."""
     tile_x: int
@@ -29,7 +31,7 @@ class NPCDef:
     sprite_style: str = "humanoid"  # "humanoid" or "robot"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnemyNPCDef:
     """Placement data for a scripted enemy encounter on the map."""
     tile_x: int
@@ -38,16 +40,21 @@ class EnemyNPCDef:
     color: tuple[int, int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class IconMarker:
     """A branding icon drawn on a wall tile."""
     x: int
     y: int
     icon_type: str  # "sword" or "shield"
-    color: tuple[int, int, int] = (255, 255, 255)
+    color: pygame.Color | tuple[int, int, int] = (255, 255, 255)
+
+    def __post_init__(self):
+        # Drawn every frame, so convert once rather than in each draw call
+        if not isinstance(self.color, pygame.Color):
+            self.color = pygame.Color(*self.color)
 
 
-@dataclass
+@dataclass(slots=True)
 class MapDef:
     """Full definition of a game map."""
     map_id: str
@@ -65,7 +72,7 @@ class MapDef:
     tmx_file: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MapPersistence:
     """Per-map mutable state that persists across visits."""
     collected_scrap: set[tuple] = field(default_factory=set)
@@ -19,10 +19,18 @@ class Minimap:
         self._color_door = (220, 200, 60)
         self._color_player = (255, 255, 255)
 
-    def update(self, player_tile_x, player_tile_y, doors, dt=0.0):
-        """Rebuild the minimap image centered on the player."""
-        self._blink_timer += dt
+        # Map geometry only changes on map load, door list change or a
+        # toggled tile, so the tile + door image is cached until then
+        self._cached_tr = None
+        self._cached_doors = None
+        self._cached_walk_version = -1
+        self._scale = 1
+        self._off_x = 0
+        self._off_y = 0
+        self._player_rect = None
 
+    def _rebuild(self, doors):
+        """Redraw the cached background, tiles and doors into self.surface."""
         tr = self.tiled_renderer
         map_w = tr.width_tiles
         map_h = tr.height_tiles
@@ -42,19 +50,13 @@ class Minimap:
 
         self.surface.fill(self._color_bg)
 
-        # Draw tiles
-        for ty in range(map_h):
-            for tx in range(map_w):
-                px = off_x + tx * scale
-                py = off_y + ty * scale
-                if tr.is_walkable(tx, ty):
-                    color = self._color_walkable
-                else:
-                    color = self._color_wall
-                if scale == 1:
-                    self.surface.set_at((px, py), color)
-                else:
-                    pygame.draw.rect(self.surface, color, (px, py, scale, scale))
+        # Draw tiles: the walkability mask doubles as an 8-bit palette image
+        # (index 0 = wall, 1 = walkable), scaled up in one call
+        tiles = pygame.image.frombytes(tr.walkable_mask(), (map_w, map_h), "P")
+        tiles.set_palette([self._color_wall, self._color_walkable])
+        if scale != 1:
+            tiles = pygame.transform.scale(tiles, (rendered_w, rendered_h))
+        self.surface.blit(tiles, (off_x, off_y))
 
         # Draw doors
         for door in doors:
@@ -65,13 +67,40 @@ class Minimap:
             else:
                 pygame.draw.rect(self.surface, self._color_door, (px, py, scale, scale))
 
-        # Draw player (blinking white dot)
+        self._scale = scale
+        self._off_x = off_x
+        self._off_y = off_y
+        self._cached_tr = tr
+        self._cached_doors = doors
+        self._cached_walk_version = tr.walkable_version
+
+    def update(self, player_tile_x, player_tile_y, doors, dt=0.0):
+        """Refresh the minimap centered on the player."""
+        self._blink_timer += dt
+
+        tr = self.tiled_renderer
+        if (
+            tr is not self._cached_tr
+            or doors is not self._cached_doors
+            or tr.walkable_version != self._cached_walk_version
+        ):
+            self._rebuild(doors)
+
+        # Player (blinking white dot) is drawn over the cached image in draw()
         if int(self._blink_timer * 3) % 2 == 0:
-            px = off_x + player_tile_x * scale
-            py = off_y + player_tile_y * scale
+            scale = self._scale
             player_size = max(scale, 2)
-            pygame.draw.rect(self.surface, self._color_player, (px, py, player_size, player_size))
+            self._player_rect = (
+                self._off_x + player_tile_x * scale,
+                self._off_y + player_tile_y * scale,
+                player_size, player_size,
+            )
+        else:
+            self._player_rect = None
 
     def draw(self, screen, x, y):
         """Blit the minimap onto the screen at (x, y)."""
         screen.blit(self.surface, (x, y))
+        if self._player_rect is not None:
+            px, py, w, h = self._player_rect
+            pygame.draw.rect(screen, self._color_player, (x + px, y + py, w, h))
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from bit_flippers.sprites import AnimatedSprite, create_placeholder_npc, create_placeholder_robot, load_npc
 
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     tile_x: int
     tile_y: int
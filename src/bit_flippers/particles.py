@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import math
 import random
+from dataclasses import dataclass
+
+_TAU = 2 * math.pi
 
 
 class Particle:
@@ -33,25 +36,57 @@ class Particle:
         self.lifetime -= dt
 
 
-def draw_particles(screen, particles: list[Particle]):
-    """Draw all living particles with alpha fade."""
-    import pygame
+# Per-radius (white circle mask, scratch surface) pairs, built on first use
+_circle_cache: dict[int, tuple] = {}
+
+
+def _circle_sprites(sz: int) -> tuple:
+    """Return the cached white mask and reusable scratch surface for radius sz."""
+    sprites = _circle_cache.get(sz)
+    if sprites is None:
+        import pygame
+        mask = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+        pygame.draw.circle(mask, (255, 255, 255, 255), (sz, sz), sz)
+        scratch = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+        sprites = _circle_cache[sz] = (mask, scratch)
+    return sprites
+
+
+def draw_particles(screen, particles: list[Particle], rewind: float = 0.0):
+    """Draw all living particles with alpha fade.
+
+    *rewind* draws each particle as it was that many seconds earlier, for
+    interpolating between simulation steps (motion is linear, so this is exact).
+    """
+    from pygame import BLEND_RGBA_MULT
     for p in particles:
-        if not p.alive:
+        if p.lifetime <= 0:
             continue
-        a = p.alpha
+        life = p.lifetime + rewind
+        a = life / p.max_lifetime if life < p.max_lifetime else 1.0
         r, g, b = p.color[0], p.color[1], p.color[2]
         sz = max(1, int(p.size * a))
-        surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (r, g, b, int(255 * a)), (sz, sz), sz)
-        screen.blit(surf, (int(p.x) - sz, int(p.y) - sz))
+        # Tint the scratch surface and cut the circle out of it with the mask,
+        # instead of allocating a fresh surface per particle per frame
+        mask, scratch = _circle_sprites(sz)
+        scratch.fill((r, g, b, int(255 * a)))
+        scratch.blit(mask, (0, 0), special_flags=BLEND_RGBA_MULT)
+        screen.blit(scratch, (int(p.x - p.vx * rewind) - sz, int(p.y - p.vy * rewind) - sz))
 
 
 def update_particles(particles: list[Particle], dt: float) -> list[Particle]:
     """Update all particles, returning only the living ones."""
+    # Single pass with the step inlined: no per-particle method call or
+    # property lookup, and no second walk to filter the dead ones
+    alive = []
+    keep = alive.append
     for p in particles:
-        p.update(dt)
-    return [p for p in particles if p.alive]
+        p.x += p.vx * dt
+        p.y += p.vy * dt
+        p.lifetime -= dt
+        if p.lifetime > 0:
+            keep(p)
+    return alive
 
 
 # ---------------------------------------------------------------------------
@@ -60,27 +95,31 @@ def update_particles(particles: list[Particle], dt: float) -> list[Particle]:
 
 def _spawn_burst(cx: float, cy: float, color: tuple, count: int,
                  speed: float, lifetime: float, size: float) -> list[Particle]:
+    # Loop-invariant bounds and hot callables are bound once per spawn
+    uniform, cos, sin = random.uniform, math.cos, math.sin
+    min_spd, min_life = speed * 0.5, lifetime * 0.6
     particles = []
     for _ in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        spd = random.uniform(speed * 0.5, speed)
-        vx = math.cos(angle) * spd
-        vy = math.sin(angle) * spd
-        c = _vary_color(color)
-        particles.append(Particle(cx, cy, vx, vy, random.uniform(lifetime * 0.6, lifetime), c, size))
+        angle = uniform(0, _TAU)
+        spd = uniform(min_spd, speed)
+        particles.append(Particle(
+            cx, cy, cos(angle) * spd, sin(angle) * spd,
+            uniform(min_life, lifetime), _vary_color(color), size,
+        ))
     return particles
 
 
 def _spawn_rise(cx: float, cy: float, color: tuple, count: int,
                 speed: float, lifetime: float, size: float) -> list[Particle]:
+    uniform = random.uniform
+    drift, min_spd, min_life = speed * 0.3, speed * 0.5, lifetime * 0.6
     particles = []
     for _ in range(count):
-        vx = random.uniform(-speed * 0.3, speed * 0.3)
-        vy = -random.uniform(speed * 0.5, speed)
-        c = _vary_color(color)
+        vx = uniform(-drift, drift)
+        vy = -uniform(min_spd, speed)
         particles.append(Particle(
-            cx + random.uniform(-12, 12), cy,
-            vx, vy, random.uniform(lifetime * 0.6, lifetime), c, size,
+            cx + uniform(-12, 12), cy,
+            vx, vy, uniform(min_life, lifetime), _vary_color(color), size,
         ))
     return particles
 
@@ -89,138 +128,159 @@ def _spawn_converge(cx: float, cy: float, tx: float, ty: float,
                     color: tuple, count: int, speed: float,
                     lifetime: float, size: float) -> list[Particle]:
     """Particles start around (cx,cy) and move toward (tx,ty)."""
+    uniform, cos, sin = random.uniform, math.cos, math.sin
+    min_spd, min_life = speed * 0.5, lifetime * 0.6
     particles = []
     for _ in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = random.uniform(30, 60)
-        sx = tx + math.cos(angle) * dist
-        sy = ty + math.sin(angle) * dist
-        dx, dy = tx - sx, ty - sy
-        d = math.hypot(dx, dy) or 1
-        spd = random.uniform(speed * 0.5, speed)
-        vx = dx / d * spd
-        vy = dy / d * spd
-        c = _vary_color(color)
-        particles.append(Particle(sx, sy, vx, vy, random.uniform(lifetime * 0.6, lifetime), c, size))
+        angle = uniform(0, _TAU)
+        dist = uniform(30, 60)
+        # The start point sits on a circle of radius dist around the target,
+        # so the unit vector back to it is just (-cos, -sin): no hypot needed
+        ux, uy = cos(angle), sin(angle)
+        spd = uniform(min_spd, speed)
+        particles.append(Particle(
+            tx + ux * dist, ty + uy * dist, -ux * spd, -uy * spd,
+            uniform(min_life, lifetime), _vary_color(color), size,
+        ))
     return particles
 
 
 def _vary_color(base: tuple) -> tuple:
     """Add slight random variation to a color."""
-    r = max(0, min(255, base[0] + random.randint(-20, 20)))
-    g = max(0, min(255, base[1] + random.randint(-20, 20)))
-    b = max(0, min(255, base[2] + random.randint(-20, 20)))
-    return (r, g, b)
+    # Chained comparisons clamp faster than max(0, min(255, ...)) in CPython
+    randint = random.randint
+    r = base[0] + randint(-20, 20)
+    g = base[1] + randint(-20, 20)
+    b = base[2] + randint(-20, 20)
+    return (
+        0 if r < 0 else 255 if r > 255 else r,
+        0 if g < 0 else 255 if g > 255 else g,
+        0 if b < 0 else 255 if b > 255 else b,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Per-skill presets
 # ---------------------------------------------------------------------------
 
-SKILL_PARTICLES: dict[str, dict] = {
-    "shrapnel_blast": {
-        "color": (220, 180, 100),
-        "pattern": "burst",
-        "count": 14,
-        "speed": 120,
-        "lifetime": 0.5,
-        "size": 3.0,
-        "target": "enemy",
-        "shake": 0,
-    },
-    "voltage_surge": {
-        "color": (180, 200, 255),
-        "pattern": "burst",
-        "count": 16,
-        "speed": 140,
-        "lifetime": 0.4,
-        "size": 2.5,
-        "target": "enemy",
-        "shake": 0,
-    },
-    "magnet_storm": {
-        "color": (180, 100, 220),
-        "pattern": "burst",
-        "count": 22,
-        "speed": 160,
-        "lifetime": 0.6,
-        "size": 3.5,
-        "target": "enemy",
-        "shake": 6,
-    },
-    "patchwork_heal": {
-        "color": (100, 220, 80),
-        "pattern": "rise",
-        "count": 12,
-        "speed": 80,
-        "lifetime": 0.7,
-        "size": 3.0,
-        "target": "player",
-        "shake": 0,
-    },
-    "jury_rig_shield": {
-        "color": (80, 140, 255),
-        "pattern": "rise",
-        "count": 10,
-        "speed": 70,
-        "lifetime": 0.6,
-        "size": 3.0,
-        "target": "player",
-        "shake": 0,
-    },
-    "scrap_leech": {
-        "color": (180, 80, 220),
-        "pattern": "converge",
-        "count": 14,
-        "speed": 100,
-        "lifetime": 0.6,
-        "size": 2.5,
-        "target": "player",
-        "shake": 0,
-    },
-    "overclock": {
-        "color": (255, 160, 60),
-        "pattern": "burst",
-        "count": 12,
-        "speed": 100,
-        "lifetime": 0.5,
-        "size": 2.5,
-        "target": "enemy",
-        "shake": 0,
-    },
-    "emp_pulse": {
-        "color": (100, 160, 255),
-        "pattern": "burst",
-        "count": 18,
-        "speed": 130,
-        "lifetime": 0.5,
-        "size": 3.0,
-        "target": "enemy",
-        "shake": 0,
-    },
-    "system_purge": {
-        "color": (200, 255, 200),
-        "pattern": "rise",
-        "count": 14,
-        "speed": 90,
-        "lifetime": 0.7,
-        "size": 3.0,
-        "target": "player",
-        "shake": 0,
-    },
+@dataclass(frozen=True, slots=True)
+class ParticlePreset:
+    """Spawn parameters for one particle effect."""
+
+    color: tuple[int, int, int]
+    pattern: str
+    count: int
+    speed: float
+    lifetime: float
+    size: float
+    target: str = "enemy"
+    shake: float = 0
+
+
+SKILL_PARTICLES: dict[str, ParticlePreset] = {
+    "shrapnel_blast": ParticlePreset(
+        color=(220, 180, 100),
+        pattern="burst",
+        count=14,
+        speed=120,
+        lifetime=0.5,
+        size=3.0,
+        target="enemy",
+        shake=0,
+    ),
+    "voltage_surge": ParticlePreset(
+        color=(180, 200, 255),
+        pattern="burst",
+        count=16,
+        speed=140,
+        lifetime=0.4,
+        size=2.5,
+        target="enemy",
+        shake=0,
+    ),
+    "magnet_storm": ParticlePreset(
+        color=(180, 100, 220),
+        pattern="burst",
+        count=22,
+        speed=160,
+        lifetime=0.6,
+        size=3.5,
+        target="enemy",
+        shake=6,
+    ),
+    "patchwork_heal": ParticlePreset(
+        color=(100, 220, 80),
+        pattern="rise",
+        count=12,
+        speed=80,
+        lifetime=0.7,
+        size=3.0,
+        target="player",
+        shake=0,
+    ),
+    "jury_rig_shield": ParticlePreset(
+        color=(80, 140, 255),
+        pattern="rise",
+        count=10,
+        speed=70,
+        lifetime=0.6,
+        size=3.0,
+        target="player",
+        shake=0,
+    ),
+    "scrap_leech": ParticlePreset(
+        color=(180, 80, 220),
+        pattern="converge",
+        count=14,
+        speed=100,
+        lifetime=0.6,
+        size=2.5,
+        target="player",
+        shake=0,
+    ),
+    "overclock": ParticlePreset(
+        color=(255, 160, 60),
+        pattern="burst",
+        count=12,
+        speed=100,
+        lifetime=0.5,
+        size=2.5,
+        target="enemy",
+        shake=0,
+    ),
+    "emp_pulse": ParticlePreset(
+        color=(100, 160, 255),
+        pattern="burst",
+        count=18,
+        speed=130,
+        lifetime=0.5,
+        size=3.0,
+        target="enemy",
+        shake=0,
+    ),
+    "system_purge": ParticlePreset(
+        color=(200, 255, 200),
+        pattern="rise",
+        count=14,
+        speed=90,
+        lifetime=0.7,
+        size=3.0,
+        target="player",
+        shake=0,
+    ),
 }
 
 # Generic presets for basic attacks / items
-GENERIC_HIT = {
-    "color": (255, 255, 255),
-    "pattern": "burst",
-    "count": 8,
-    "speed": 80,
-    "lifetime": 0.3,
-    "size": 2.0,
-    "target": "enemy",
-    "shake": 0,
-}
+GENERIC_HIT = ParticlePreset(
+    color=(255, 255, 255),
+    pattern="burst",
+    count=8,
+    speed=80,
+    lifetime=0.3,
+    size=2.0,
+    target="enemy",
+    shake=0,
+)
 
 
 def spawn_particles(cx: float, cy: float, preset_key: str,
@@ -230,12 +290,12 @@ def spawn_particles(cx: float, cy: float, preset_key: str,
     For 'converge' patterns, target_pos is the destination point.
     """
     preset = SKILL_PARTICLES.get(preset_key, GENERIC_HIT)
-    color = preset["color"]
-    count = preset["count"]
-    speed = preset["speed"]
-    lifetime = preset["lifetime"]
-    size = preset["size"]
-    pattern = preset["pattern"]
+    color = preset.color
+    count = preset.count
+    speed = preset.speed
+    lifetime = preset.lifetime
+    size = preset.size
+    pattern = preset.pattern
 
     if pattern == "burst":
         return _spawn_burst(cx, cy, color, count, speed, lifetime, size)
@@ -252,15 +312,28 @@ def get_shake_intensity(preset_key: str) -> float:
     """Return screen shake intensity for a skill, or 0."""
     preset = SKILL_PARTICLES.get(preset_key)
     if preset:
-        return preset.get("shake", 0)
+        return preset.shake
     return 0
 
 
+# Unit-range jitter pairs for shake_offset(), generated once from a fixed seed
+# and cycled through, so shaking costs no RNG calls per frame
+_SHAKE_MASK = 255
+_shake_rng = random.Random(1)
+_SHAKE_TABLE: tuple[tuple[float, float], ...] = tuple(
+    (_shake_rng.uniform(-1, 1), _shake_rng.uniform(-1, 1))
+    for _ in range(_SHAKE_MASK + 1)
+)
+del _shake_rng
+_shake_idx = 0
+
+
 def shake_offset(intensity: float, timer: float) -> tuple[int, int]:
     """Return a (dx, dy) screen shake offset that decays over time."""
     if intensity <= 0 or timer <= 0:
         return (0, 0)
+    global _shake_idx
     mag = intensity * min(1.0, timer / 0.3)
-    dx = int(random.uniform(-mag, mag))
-    dy = int(random.uniform(-mag, mag))
-    return (dx, dy)
+    ux, uy = _SHAKE_TABLE[_shake_idx & _SHAKE_MASK]
+    _shake_idx += 1
+    return (int(ux * mag), int(uy * mag))
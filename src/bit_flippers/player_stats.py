@@ -1,8 +1,8 @@
 """Player stats, combat formulas, and stat allocation."""
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     max_hp: int = 30
     max_sp: int = 10
@@ -18,6 +18,13 @@ class PlayerStats:
     current_hp: int = 30
     current_sp: int = 10
 
+    def to_dict(self) -> dict[str, int]:
+        # Every field is an int, so a shallow read replaces asdict()'s deepcopy
+        return {name: getattr(self, name) for name in _STAT_FIELDS}
+
+
+_STAT_FIELDS = tuple(f.name for f in fields(PlayerStats))
+
 
 # ---------------------------------------------------------------------------
 # Combat formula functions
@@ -27,7 +34,7 @@ def effective_attack(stats: PlayerStats, equipment=None) -> int:
     """Derive attack power from stats. At level 1: 3 + 5 = 8 (matches original)."""
     bonus = 0
     if equipment is not None:
-        bonus = equipment.get_total_bonuses().get("strength", 0)
+        bonus = equipment.get_bonus("strength")
     return 3 + stats.strength + bonus
 
 
@@ -35,22 +42,23 @@ def effective_defense(stats: PlayerStats, equipment=None) -> int:
     """Derive defense from stats. At level 1: 3 (matches original)."""
     bonus = 0
     if equipment is not None:
-        bonus = equipment.get_total_bonuses().get("resilience", 0)
+        bonus = equipment.get_bonus("resilience")
     return stats.resilience + bonus
 
 
 def calc_hit_chance(attacker_dex: int, defender_dex: int) -> float:
     """Calculate hit probability. Base 85%, +3% per dex advantage, clamped [30%, 99%]."""
-    base = 0.85
-    diff = attacker_dex - defender_dex
-    chance = base + diff * 0.03
-    return max(0.30, min(0.99, chance))
+    chance = 0.85 + (attacker_dex - defender_dex) * 0.03
+    # Conditional clamp: avoids two builtin calls on every attack roll
+    return 0.30 if chance < 0.30 else 0.99 if chance > 0.99 else chance
 
 
 def calc_debuff_duration(base_turns: int, constitution: int) -> int:
     """Reduce debuff duration by 1 per 3 CON above 3, minimum 1 turn."""
-    reduction = max(0, (constitution - 3) // 3)
-    return max(1, base_turns - reduction)
+    if constitution < 6:
+        return base_turns if base_turns > 1 else 1
+    turns = base_turns - (constitution - 3) // 3
+    return turns if turns > 1 else 1
 
 
 # ---------------------------------------------------------------------------
@@ -99,3 +107,9 @@ STAT_DISPLAY_NAMES: dict[str, str] = {
     "constitution": "CON",
     "intelligence": "INT",
 }
+
+# (stat_key, display_name, increment) per row, in STAT_ORDER, so the
+# character screen walks one tuple instead of keying three dicts per row
+STAT_ROWS: tuple[tuple[str, str, int], ...] = tuple(
+    (key, STAT_DISPLAY_NAMES[key], STAT_POINT_VALUES[key]) for key in STAT_ORDER
+)
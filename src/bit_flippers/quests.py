@@ -3,8 +3,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from bit_flippers.player_stats import points_for_level
+from bit_flippers.settings import BASE_XP
+from bit_flippers.skills import skill_points_for_level
 
-@dataclass
+
+@dataclass(slots=True)
 class QuestObjective:
     obj_type: str  # "fetch", "kill", "visit"
     target: str  # item name, enemy name, or map_id
@@ -241,8 +245,20 @@ _QUEST_LIST = [
     ),
 ]
 
+# giver NPC name -> quest_ids they offer, in registry order
+_QUESTS_BY_GIVER: dict[str, list[str]] = {}
+# quest_id -> prerequisite quest_ids, normalized from str | list | None
+_PREREQS: dict[str, tuple[str, ...]] = {}
+
 for _q in _QUEST_LIST:
     QUEST_REGISTRY[_q.quest_id] = _q
+    _QUESTS_BY_GIVER.setdefault(_q.giver_npc, []).append(_q.quest_id)
+    if _q.prerequisite is None:
+        _PREREQS[_q.quest_id] = ()
+    elif isinstance(_q.prerequisite, list):
+        _PREREQS[_q.quest_id] = tuple(_q.prerequisite)
+    else:
+        _PREREQS[_q.quest_id] = (_q.prerequisite,)
 
 
 # ---------------------------------------------------------------------------
@@ -257,26 +273,66 @@ class PlayerQuests:
         self.states: dict[str, str] = {}
         # quest_id -> list of QuestObjective
         self.objectives: dict[str, list[QuestObjective]] = {}
+        # Objectives of active quests, indexed by the event that advances
+        # them: (obj_type, target) -> [(quest_id, objective)] for kill/visit,
+        # plus a flat list for fetch (re-counted on any inventory change)
+        self._watchers: dict[tuple[str, str], list[tuple[str, QuestObjective]]] = {}
+        self._fetch_watchers: list[tuple[str, QuestObjective]] = []
+        # Number of quests in the "complete" state, read by the HUD each frame
+        self._complete_count = 0
+        # get_state() results for quests not yet in self.states; prereqs only
+        # change when a state does, so _set_state() clears this
+        self._derived_states: dict[str, str | None] = {}
+
+    def _set_state(self, quest_id: str, state: str) -> None:
+        self.states[quest_id] = state
+        self._derived_states.clear()
+
+    def _watch(self, quest_id: str) -> None:
+        """Index an active quest's objectives for the update_* hooks."""
+        for obj in self.objectives.get(quest_id, []):
+            entry = (quest_id, obj)
+            if obj.obj_type == "fetch":
+                self._fetch_watchers.append(entry)
+            else:
+                self._watchers.setdefault((obj.obj_type, obj.target), []).append(entry)
+
+    def _unwatch(self, quest_id: str) -> None:
+        """Drop a quest's objectives from the update indexes."""
+        for obj in self.objectives.get(quest_id, []):
+            entry = (quest_id, obj)
+            if obj.obj_type == "fetch":
+                self._fetch_watchers.remove(entry)
+            else:
+                key = (obj.obj_type, obj.target)
+                entries = self._watchers[key]
+                entries.remove(entry)
+                if not entries:
+                    del self._watchers[key]
 
     def _check_available(self, quest_id: str) -> bool:
         """Check if a quest's prerequisites are met."""
-        qdef = QUEST_REGISTRY.get(quest_id)
-        if qdef is None:
+        prereqs = _PREREQS.get(quest_id)
+        if prereqs is None:
             return False
-        prereq = qdef.prerequisite
-        if prereq is None:
-            return True
-        if isinstance(prereq, list):
-            return all(self.states.get(p) == "done" for p in prereq)
-        return self.states.get(prereq) == "done"
+        states = self.states
+        for p in prereqs:
+            if states.get(p) != "done":
+                return False
+        return True
 
     def get_state(self, quest_id: str) -> str | None:
         """Return quest state, auto-promoting to 'available' if prereqs met."""
-        if quest_id in self.states:
-            return self.states[quest_id]
-        if self._check_available(quest_id):
-            return "available"
-        return None
+        state = self.states.get(quest_id)
+        if state is not None:
+            return state
+        try:
+            return self._derived_states[quest_id]
+        except KeyError:
+            pass
+        state = "available" if self._check_available(quest_id) else None
+        self._derived_states[quest_id] = state
+        return state
 
     def get_npc_quest(self, npc_name: str) -> tuple[str, str] | None:
         """Find the most relevant quest for an NPC.
@@ -285,9 +341,7 @@ class PlayerQuests:
         Priority: complete > active > available.
         """
         best = None
-        for qid, qdef in QUEST_REGISTRY.items():
-            if qdef.giver_npc != npc_name:
-                continue
+        for qid in _QUESTS_BY_GIVER.get(npc_name, ()):
             state = self.get_state(qid)
             if state is None:
                 continue
@@ -309,45 +363,43 @@ class PlayerQuests:
         if self.get_state(quest_id) != "available":
             return False
         qdef = QUEST_REGISTRY[quest_id]
-        self.states[quest_id] = "active"
+        self._set_state(quest_id, "active")
         self.objectives[quest_id] = [
-            QuestObjective(
-                obj_type=o["obj_type"],
-                target=o["target"],
-                required=o["required"],
-            )
+            QuestObjective(o["obj_type"], o["target"], o["required"])
             for o in qdef.objectives
         ]
+        self._watch(quest_id)
         return True
 
     def update_kill(self, enemy_name: str) -> None:
         """Increment kill counts for active quests matching enemy_name."""
-        for qid, state in list(self.states.items()):
-            if state != "active":
-                continue
-            for obj in self.objectives.get(qid, []):
-                if obj.obj_type == "kill" and obj.target == enemy_name:
-                    obj.current = min(obj.current + 1, obj.required)
+        entries = self._watchers.get(("kill", enemy_name))
+        if not entries:
+            return
+        for _qid, obj in entries:
+            obj.current = min(obj.current + 1, obj.required)
+        for qid in {qid for qid, _obj in entries}:
             self._check_complete(qid)
 
     def update_visit(self, map_id: str) -> None:
         """Mark visit objectives complete for active quests."""
-        for qid, state in list(self.states.items()):
-            if state != "active":
-                continue
-            for obj in self.objectives.get(qid, []):
-                if obj.obj_type == "visit" and obj.target == map_id:
-                    obj.current = obj.required
+        entries = self._watchers.get(("visit", map_id))
+        if not entries:
+            return
+        for _qid, obj in entries:
+            obj.current = obj.required
+        for qid in {qid for qid, _obj in entries}:
             self._check_complete(qid)
 
     def update_fetch(self, inventory) -> None:
         """Update fetch objectives based on current inventory counts."""
-        for qid, state in list(self.states.items()):
-            if state != "active":
-                continue
-            for obj in self.objectives.get(qid, []):
-                if obj.obj_type == "fetch":
-                    obj.current = min(inventory.get_count(obj.target), obj.required)
+        entries = self._fetch_watchers
+        if not entries:
+            return
+        counts = inventory.get_counts([obj.target for _qid, obj in entries])
+        for (_qid, obj), count in zip(entries, counts):
+            obj.current = count if count < obj.required else obj.required
+        for qid in {qid for qid, _obj in entries}:
             self._check_complete(qid)
 
     def _check_complete(self, quest_id: str) -> None:
@@ -356,7 +408,9 @@ class PlayerQuests:
             return
         objs = self.objectives.get(quest_id, [])
         if all(o.current >= o.required for o in objs):
-            self.states[quest_id] = "complete"
+            self._set_state(quest_id, "complete")
+            self._complete_count += 1
+            self._unwatch(quest_id)
 
     def claim_rewards(self, quest_id: str, overworld) -> bool:
         """Claim rewards for a completed quest. Returns True on success."""
@@ -373,10 +427,6 @@ class PlayerQuests:
         if xp > 0:
             overworld.stats.xp += xp
             # Trigger level-up checks
-            from bit_flippers.settings import BASE_XP
-            from bit_flippers.skills import skill_points_for_level
-            from bit_flippers.player_stats import points_for_level
-
             while overworld.stats.xp >= overworld.stats.level * BASE_XP:
                 overworld.stats.xp -= overworld.stats.level * BASE_XP
                 overworld.stats.level += 1
@@ -395,19 +445,20 @@ class PlayerQuests:
 
         # Skills (unlock directly)
         for skill_id in rewards.get("skills", []):
-            overworld.player_skills.unlocked.add(skill_id)
+            overworld.player_skills.grant(skill_id)
 
         # Consume fetched items from inventory
         for obj in self.objectives.get(quest_id, []):
             if obj.obj_type == "fetch":
                 overworld.inventory.remove(obj.target, obj.required)
 
-        self.states[quest_id] = "done"
+        self._set_state(quest_id, "done")
+        self._complete_count -= 1
         return True
 
     def has_completable(self) -> bool:
         """Check if any quest is in the 'complete' state."""
-        return any(s == "complete" for s in self.states.values())
+        return self._complete_count > 0
 
     def get_all_quests(self) -> list[tuple[str, str]]:
         """Return list of (quest_id, state) for all known/available quests."""
@@ -437,12 +488,12 @@ class PlayerQuests:
         pq.states = dict(data.get("states", {}))
         for qid, obj_list in data.get("objectives", {}).items():
             pq.objectives[qid] = [
-                QuestObjective(
-                    obj_type=o["obj_type"],
-                    target=o["target"],
-                    required=o["required"],
-                    current=o.get("current", 0),
-                )
+                QuestObjective(o["obj_type"], o["target"], o["required"], o.get("current", 0))
                 for o in obj_list
             ]
+        for qid, state in pq.states.items():
+            if state == "active":
+                pq._watch(qid)
+            elif state == "complete":
+                pq._complete_count += 1
         return pq
@@ -1,12 +1,21 @@
 """Full save/load system with 5 save slots."""
 import json
+import logging
 import os
 import shutil
 import sys
 import time
-from dataclasses import asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 
-_SAVE_VERSION = 2
+try:
+    import orjson
+except ImportError:  # the "fast-saves" extra; the stdlib encoder is the baseline
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_SAVE_VERSION = 3  # 3: collected_scrap stored as a flat [x0, y0, x1, y1, ...] list
 _NUM_SLOTS = 5
 
 # Old project-root save dir (for migration)
@@ -15,6 +24,11 @@ _OLD_SAVE_DIR = os.path.normpath(
 )
 
 _save_dir_cache: str | None = None
+# Resolved alongside _save_dir_cache so per-slot lookups skip os.path.join
+_slot_paths: tuple[str, ...] = ()
+_slot_meta_paths: tuple[str, ...] = ()
+_legacy_save_path = ""
+_config_file_path = ""
 
 
 def _get_save_dir() -> str:
@@ -24,7 +38,7 @@ def _get_save_dir() -> str:
     Linux:   ~/.local/share/BitFlippers/
     Windows: %APPDATA%/BitFlippers/
     """
-    global _save_dir_cache
+    global _save_dir_cache, _slot_paths, _slot_meta_paths, _legacy_save_path, _config_file_path
     if _save_dir_cache is not None:
         return _save_dir_cache
 
@@ -41,6 +55,14 @@ def _get_save_dir() -> str:
     # Legacy migration: copy old project-root saves to new location
     _migrate_legacy_saves(save_dir)
 
+    _slot_paths = tuple(
+        os.path.join(save_dir, f"savegame_{slot}.json") for slot in range(_NUM_SLOTS)
+    )
+    _slot_meta_paths = tuple(
+        os.path.join(save_dir, f"savegame_{slot}.meta.json") for slot in range(_NUM_SLOTS)
+    )
+    _legacy_save_path = os.path.join(save_dir, "savegame.json")
+    _config_file_path = os.path.join(save_dir, "config.json")
     _save_dir_cache = save_dir
     return save_dir
 
@@ -61,12 +83,97 @@ def _migrate_legacy_saves(new_dir: str) -> None:
         os.remove(old_legacy)
 
 
+# File names has_save(None) looks for: every slot plus the legacy single save
+_SAVE_FILE_NAMES = frozenset(
+    [f"savegame_{slot}.json" for slot in range(_NUM_SLOTS)] + ["savegame.json"]
+)
+
+
+def _existing_save_files() -> set[str]:
+    """Return the names of regular files in the save dir, in one directory scan."""
+    with os.scandir(_get_save_dir()) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
 def _slot_path(slot: int) -> str:
-    return os.path.join(_get_save_dir(), f"savegame_{slot}.json")
+    if _save_dir_cache is None:
+        _get_save_dir()
+    return _slot_paths[slot]
+
+
+def _slot_meta_path(slot: int) -> str:
+    if _save_dir_cache is None:
+        _get_save_dir()
+    return _slot_meta_paths[slot]
 
 
 def _legacy_path() -> str:
-    return os.path.join(_get_save_dir(), "savegame.json")
+    if _save_dir_cache is None:
+        _get_save_dir()
+    return _legacy_save_path
+
+
+# Single background thread for save writes, created on first save
+_writer: ThreadPoolExecutor | None = None
+# slot -> most recent write queued for it
+_pending_writes: dict[int, Future] = {}
+# has_save() answers: slot (None = any) -> (time.monotonic() checked, exists)
+_HAS_SAVE_TTL = 0.5
+_has_save_cache: dict[int | None, tuple[float, bool]] = {}
+# slot -> (save file mtime, summary) for get_slot_summary()
+_summary_cache: dict[int, tuple[float, dict]] = {}
+# slot -> (state, map persistence) of the last save_game() write there,
+# without the timestamp; see save_game()
+_last_saved: dict[int, tuple[dict, dict]] = {}
+
+
+def _encode(data: dict) -> bytes:
+    """Encode a save dict as compact JSON bytes (orjson when installed).
+
+    Every key in a save dict is a str (orjson rejects anything else where the
+    stdlib would coerce it), so either encoder writes files the other reads.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _read_json(path: str):
+    """Read and decode a JSON file in one read (orjson when installed).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib type either way.
+    """
+    with open(path, "rb") as f:
+        blob = f.read()
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _replace_file(path: str, blob: bytes) -> None:
+    """Atomically replace *path* with *blob* via a temp file and os.replace.
+
+    A crash mid-write leaves the previous file intact instead of a truncated
+    one that load_game() would reject as corrupt. The data is fsynced before
+    the rename so a power loss can't leave an empty file in its place; save
+    writes run on the background writer, so the wait doesn't cost a frame.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _write_save(path: str, data: dict) -> None:
+    """Write a save dict as compact JSON in a single write.
+
+    Without indent the stdlib encoder takes its C fast path, and encoding to
+    one string avoids json.dump's many small buffered writes.
+    """
+    _replace_file(path, _encode(data))
 
 
 def save_game(overworld, slot: int | None = None) -> None:
@@ -80,11 +187,10 @@ def save_game(overworld, slot: int | None = None) -> None:
 
     stats = overworld.stats
     equipment = getattr(overworld, "equipment", None)
-    data = {
+    state = {
         "version": _SAVE_VERSION,
         "slot": slot,
-        "timestamp": time.time(),
-        "stats": asdict(stats),
+        "stats": stats.to_dict(),
         "skills": overworld.player_skills.to_dict(),
         "inventory": overworld.inventory.to_dict(),
         "equipment": equipment.to_dict() if equipment else {},
@@ -95,18 +201,82 @@ def save_game(overworld, slot: int | None = None) -> None:
         "player_facing": overworld.player_facing,
         "steps_since_encounter": overworld.encounters.steps_since_encounter,
         "player_sprite_key": getattr(overworld, "player_sprite_key", "pipoya-characters/Male/Male 01-1"),
-        "map_persistence": {},
     }
+    persistence = {
+        map_id: (
+            frozenset(persist.collected_scrap),
+            frozenset(persist.defeated_enemies),
+            frozenset(persist.triggered_events),
+        )
+        for map_id, persist in overworld.map_persistence.items()
+    }
+
+    # Autosaves and menu saves often repeat the last state verbatim; skip the
+    # rewrite when nothing changed. The check compares the data itself, not
+    # its encoding: sets compare equal whatever their iteration order, and a
+    # skipped save costs no encode at all.
+    path = _slot_path(slot)
+    snapshot = (state, persistence)
+    if _last_saved.get(slot) == snapshot and os.path.isfile(path):
+        return
+    _last_saved[slot] = snapshot
 
-    for map_id, persist in overworld.map_persistence.items():
+    data = {**state, "timestamp": time.time(), "map_persistence": {}}
+    for map_id, (scrap, defeated, events) in persistence.items():
         data["map_persistence"][map_id] = {
-            "collected_scrap": sorted([list(t) for t in persist.collected_scrap]),
-            "defeated_enemies": sorted(persist.defeated_enemies),
-            "triggered_events": sorted([list(t) for t in persist.triggered_events]),
+            # Loaded back into sets, so no need to sort; scrap is flat
+            # [x0, y0, x1, y1, ...]
+            "collected_scrap": list(chain.from_iterable(scrap)),
+            "defeated_enemies": list(defeated),
+            "triggered_events": [list(t) for t in events],
         }
 
-    with open(_slot_path(slot), "w") as f:
-        json.dump(data, f, indent=2)
+    # Encode here, write on the background thread: autosaves happen mid-play
+    # and the disk write shouldn't cost a frame. A queued write for this slot
+    # that hasn't started is superseded by this one.
+    # The small .meta.json companion lets the save menu skip the full save.
+    global _writer
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+    previous = _pending_writes.get(slot)
+    if previous is not None:
+        previous.cancel()
+    _has_save_cache.clear()
+    # mtime alone can miss two saves within the filesystem's timestamp
+    # granularity, so drop the summary explicitly too
+    _summary_cache.pop(slot, None)
+    _pending_writes[slot] = _writer.submit(
+        _write_slot_files, slot,
+        path, _encode(data),
+        _slot_meta_path(slot), _encode(_summarize(data)),
+    )
+
+
+def _write_slot_files(slot: int, path: str, blob: bytes,
+                      meta_path: str, meta_blob: bytes) -> None:
+    """Background half of save_game(): replace the save and its meta file."""
+    try:
+        _replace_file(path, blob)
+        _replace_file(meta_path, meta_blob)
+    except OSError:
+        # Nobody is waiting on this write to report to; log it and forget the
+        # snapshot so the next save_game() retries
+        logger.exception("Failed to write save slot %d", slot)
+        _last_saved.pop(slot, None)
+
+
+def _wait_for_writes(slot: int | None = None) -> None:
+    """Block until queued writes for *slot* (or every slot) hit the disk."""
+    slots = list(_pending_writes) if slot is None else [slot]
+    for s in slots:
+        future = _pending_writes.pop(s, None)
+        if future is not None and not future.cancelled():
+            future.result()
+
+
+def flush_saves() -> None:
+    """Finish all background save writes; call before exiting."""
+    _wait_for_writes()
 
 
 def load_game(slot: int = 0) -> dict | None:
@@ -114,6 +284,7 @@ def load_game(slot: int = 0) -> dict | None:
 
     For slot 0, also checks for legacy savegame.json and migrates it.
     """
+    _wait_for_writes(slot)
     path = _slot_path(slot)
 
     # Legacy migration: if slot 0 requested and new file doesn't exist, try old path
@@ -121,22 +292,20 @@ def load_game(slot: int = 0) -> dict | None:
         legacy = _legacy_path()
         if os.path.isfile(legacy):
             try:
-                with open(legacy, "r") as f:
-                    data = json.load(f)
+                data = _read_json(legacy)
                 if isinstance(data, dict) and "version" in data:
                     # Migrate: save to new slot path and remove legacy
                     data["slot"] = 0
                     data["timestamp"] = data.get("timestamp", os.path.getmtime(legacy))
-                    with open(path, "w") as f:
-                        json.dump(data, f, indent=2)
+                    _write_save(path, data)
                     os.remove(legacy)
+                    _has_save_cache.clear()
                     return data
             except (json.JSONDecodeError, TypeError, OSError):
                 pass
 
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
+        data = _read_json(path)
         if not isinstance(data, dict) or "version" not in data:
             return None
         return data
@@ -149,22 +318,53 @@ def has_save(slot: int | None = None) -> bool:
 
     If slot is None, check if ANY slot has a save.
     """
+    # The title screen asks every frame; answer from a short-lived cache
+    now = time.monotonic()
+    cached = _has_save_cache.get(slot)
+    if cached is not None and now - cached[0] < _HAS_SAVE_TTL:
+        return cached[1]
+
+    _wait_for_writes(slot)
     if slot is not None:
-        return os.path.isfile(_slot_path(slot))
-    # Check all slots + legacy
-    for s in range(_NUM_SLOTS):
-        if os.path.isfile(_slot_path(s)):
-            return True
-    if os.path.isfile(_legacy_path()):
-        return True
-    return False
+        exists = os.path.isfile(_slot_path(slot))
+    else:
+        # Check all slots + legacy
+        exists = any(name in _SAVE_FILE_NAMES for name in _existing_save_files())
+    _has_save_cache[slot] = (now, exists)
+    return exists
 
 
 def get_slot_summary(slot: int) -> dict | None:
-    """Return a summary dict {level, map_id, money, timestamp} or None if empty."""
+    """Return a summary dict {level, map_id, money, timestamp} or None if empty.
+
+    Reads the slot's .meta.json companion when present, falling back to the
+    full save for files written before it existed (or migrated legacy saves).
+    Summaries are cached until the save file's mtime changes.
+    """
+    _wait_for_writes(slot)
+    try:
+        mtime = os.stat(_slot_path(slot)).st_mtime
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        cached = _summary_cache.get(slot)
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+        try:
+            summary = _read_json(_slot_meta_path(slot))
+            if isinstance(summary, dict):
+                _summary_cache[slot] = (mtime, summary)
+                return dict(summary)
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            pass
     data = load_game(slot)
     if data is None:
         return None
+    return _summarize(data)
+
+
+def _summarize(data: dict) -> dict:
+    """Build the save-menu summary for a full save dict."""
     stats = data.get("stats", {})
     return {
         "level": stats.get("level", 1),
@@ -180,49 +380,64 @@ def delete_save(slot: int | None = None) -> None:
     If slot is None, delete ALL slots and legacy file.
     If slot is specified, delete only that slot.
     """
+    _wait_for_writes(slot)
+    _has_save_cache.clear()
     if slot is not None:
-        path = _slot_path(slot)
-        if os.path.isfile(path):
-            os.remove(path)
+        _summary_cache.pop(slot, None)
+    else:
+        _summary_cache.clear()
+    if slot is not None:
+        _last_saved.pop(slot, None)
+        for path in (_slot_path(slot), _slot_meta_path(slot)):
+            if os.path.isfile(path):
+                os.remove(path)
         return
 
-    # Delete all slots
-    for s in range(_NUM_SLOTS):
-        path = _slot_path(s)
-        if os.path.isfile(path):
+    _last_saved.clear()
+
+    # Delete all slots and their meta files, plus the legacy files
+    save_dir = _get_save_dir()
+    existing = _existing_save_files()
+    for path in _slot_paths + _slot_meta_paths + (_legacy_path(),):
+        if os.path.basename(path) in existing:
             os.remove(path)
-    # Also remove legacy files
-    legacy = _legacy_path()
-    if os.path.isfile(legacy):
-        os.remove(legacy)
-    legacy_stats = os.path.join(_get_save_dir(), "player_stats.json")
-    if os.path.isfile(legacy_stats):
-        os.remove(legacy_stats)
+    if "player_stats.json" in existing:
+        os.remove(os.path.join(save_dir, "player_stats.json"))
 
 
 # ---------------------------------------------------------------------------
 # Config (volume preferences, etc.)
 # ---------------------------------------------------------------------------
 
+_config_cache: dict | None = None
+
+
 def _config_path() -> str:
-    return os.path.join(_get_save_dir(), "config.json")
+    if _save_dir_cache is None:
+        _get_save_dir()
+    return _config_file_path
 
 
 def load_config() -> dict:
-    """Load config.json from save directory, returning defaults if absent."""
-    path = _config_path()
-    try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        if isinstance(data, dict):
-            return data
-    except (FileNotFoundError, json.JSONDecodeError, TypeError):
-        pass
-    return {}
+    """Load config.json from save directory, returning defaults if absent.
+
+    The file is read once per session; callers get a copy they may modify.
+    """
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = {}
+        path = _config_path()
+        try:
+            data = _read_json(path)
+            if isinstance(data, dict):
+                _config_cache = data
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            pass
+    return dict(_config_cache)
 
 
 def save_config(config: dict) -> None:
     """Write config.json to save directory."""
-    path = _config_path()
-    with open(path, "w") as f:
-        json.dump(config, f, indent=2)
+    global _config_cache
+    _replace_file(_config_path(), json.dumps(config, indent=2).encode())
+    _config_cache = dict(config)
@@ -6,6 +6,9 @@ HUD_HEIGHT = 120
 HUD_Y = 360
 TILE_SIZE = 32
 FPS = 60
+# Simulation always advances in fixed steps of this length, independent of
+# the frame rate; states that draw moving things interpolate between steps
+SIM_DT = 1.0 / 60
 
 # Colors
 COLOR_BLACK = (0, 0, 0)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillDef:
     skill_id: str
     name: str
@@ -16,19 +16,37 @@ class SkillDef:
     scaling_factor: float
     tree_row: int
     tree_col: int
-    prerequisites: list[str] = field(default_factory=list)
+    prerequisites: tuple[str, ...] = ()
     unlock_cost: int = 1
+    # calc_skill_effect() as a straight line in the scaling stat:
+    # base * (1 + (stat - 3) * factor) == _mul * stat + _add
+    _scaling_stat: str | None = field(init=False, repr=False, compare=False)
+    _mul: float = field(init=False, repr=False, compare=False)
+    _add: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.stat_scaling in _SCALING_STATS:
+            stat, mul = self.stat_scaling, self.base_value * self.scaling_factor
+            add = self.base_value * (1.0 - 3 * self.scaling_factor)
+        else:
+            # Unscaled skills act as if the stat sat at the neutral baseline
+            stat, mul, add = None, 0.0, float(self.base_value)
+        object.__setattr__(self, "_scaling_stat", stat)
+        object.__setattr__(self, "_mul", mul)
+        object.__setattr__(self, "_add", add)
+
+
+_SCALING_STATS = frozenset({"intelligence", "strength"})
 
 
 def calc_skill_effect(skill: SkillDef, stats) -> int:
     """Calculate scaled skill effect value based on player stats."""
-    if skill.stat_scaling == "intelligence":
-        stat_value = stats.intelligence
-    elif skill.stat_scaling == "strength":
-        stat_value = stats.strength
+    stat = skill._scaling_stat
+    if stat is None:
+        value = int(skill._add)
     else:
-        stat_value = 3  # neutral baseline
-    return max(1, int(skill.base_value * (1.0 + (stat_value - 3) * skill.scaling_factor)))
+        value = int(skill._mul * getattr(stats, stat) + skill._add)
+    return value if value > 1 else 1
 
 
 # ---------------------------------------------------------------------------
@@ -61,7 +79,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=0,
         tree_col=0,
-        prerequisites=[],
+        prerequisites=(),
         unlock_cost=1,
     ),
     SkillDef(
@@ -75,7 +93,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=0,
         tree_col=2,
-        prerequisites=[],
+        prerequisites=(),
         unlock_cost=1,
     ),
     # Tier 1
@@ -90,7 +108,7 @@ _SKILL_LIST = [
         scaling_factor=0.08,
         tree_row=1,
         tree_col=0,
-        prerequisites=["shrapnel_blast"],
+        prerequisites=("shrapnel_blast",),
         unlock_cost=1,
     ),
     SkillDef(
@@ -104,7 +122,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=1,
         tree_col=1,
-        prerequisites=["shrapnel_blast"],
+        prerequisites=("shrapnel_blast",),
         unlock_cost=1,
     ),
     SkillDef(
@@ -118,7 +136,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=1,
         tree_col=2,
-        prerequisites=["jury_rig_shield"],
+        prerequisites=("jury_rig_shield",),
         unlock_cost=1,
     ),
     # Tier 2
@@ -133,7 +151,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=2,
         tree_col=0,
-        prerequisites=["voltage_surge"],
+        prerequisites=("voltage_surge",),
         unlock_cost=2,
     ),
     SkillDef(
@@ -147,7 +165,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=2,
         tree_col=1,
-        prerequisites=["scrap_leech"],
+        prerequisites=("scrap_leech",),
         unlock_cost=2,
     ),
     SkillDef(
@@ -161,7 +179,7 @@ _SKILL_LIST = [
         scaling_factor=0.05,
         tree_row=2,
         tree_col=2,
-        prerequisites=["overclock"],
+        prerequisites=("overclock",),
         unlock_cost=2,
     ),
     # Tier 3
@@ -176,7 +194,7 @@ _SKILL_LIST = [
         scaling_factor=0,
         tree_row=3,
         tree_col=1,
-        prerequisites=["patchwork_heal"],
+        prerequisites=("patchwork_heal",),
         unlock_cost=2,
     ),
 ]
@@ -209,6 +227,8 @@ class PlayerSkills:
     def __init__(self) -> None:
         self.unlocked: set[str] = set()
         self.skill_points: int = 0
+        # Built on demand; reset whenever `unlocked` changes through this class
+        self._unlocked_cache: list[SkillDef] | None = None
 
     def can_unlock(self, skill_id: str) -> bool:
         """Check whether a skill can be unlocked right now."""
@@ -231,11 +251,22 @@ class PlayerSkills:
         skill = SKILL_DEFS[skill_id]
         self.skill_points -= skill.unlock_cost
         self.unlocked.add(skill_id)
+        self._unlocked_cache = None
         return True
 
+    def grant(self, skill_id: str) -> None:
+        """Unlock a skill for free, bypassing cost and prerequisites."""
+        self.unlocked.add(skill_id)
+        self._unlocked_cache = None
+
     def get_unlocked_skills(self) -> list[SkillDef]:
-        """Return list of SkillDef for all unlocked skills."""
-        return [SKILL_DEFS[sid] for sid in self.unlocked if sid in SKILL_DEFS]
+        """Return list of SkillDef for all unlocked skills.
+
+        The list is cached and shared between calls; don't mutate it.
+        """
+        if self._unlocked_cache is None:
+            self._unlocked_cache = [SKILL_DEFS[sid] for sid in self.unlocked if sid in SKILL_DEFS]
+        return self._unlocked_cache
 
     def to_dict(self) -> dict:
         return {
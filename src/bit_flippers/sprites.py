@@ -8,6 +8,20 @@ _ASSET_DIR = os.path.normpath(
 )
 
 
+def make_surface(size, alpha=False):
+    """Create a Surface already in the display's pixel format.
+
+    Blits between matching formats skip per-pixel conversion, so surfaces
+    that are drawn every frame should come from here. Requires the display
+    mode to be set.
+    """
+    if alpha:
+        surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        surf.fill((0, 0, 0, 0))
+        return surf
+    return pygame.Surface(size).convert()
+
+
 class SpriteSheet:
     def __init__(self, surface, frame_width, frame_height):
         self.surface = surface
@@ -15,14 +29,20 @@ class SpriteSheet:
         self.frame_height = frame_height
 
     def get_frame(self, col, row):
-        """Extract a single frame by grid position."""
-        frame = pygame.Surface((self.frame_width, self.frame_height), pygame.SRCALPHA)
-        frame.blit(
-            self.surface,
-            (0, 0),
-            (col * self.frame_width, row * self.frame_height,
-             self.frame_width, self.frame_height),
+        """Extract a single frame by grid position.
+
+        Returns a subsurface sharing the sheet's pixels (frames are only ever
+        blitted, never drawn on), so no pixels are copied.
+        """
+        rect = pygame.Rect(
+            col * self.frame_width, row * self.frame_height,
+            self.frame_width, self.frame_height,
         )
+        if self.surface.get_rect().contains(rect):
+            return self.surface.subsurface(rect)
+        # Frame hangs off the edge of an undersized sheet: copy what exists
+        frame = pygame.Surface((self.frame_width, self.frame_height), pygame.SRCALPHA)
+        frame.blit(self.surface, (0, 0), rect)
         return frame
 
 
@@ -33,24 +53,55 @@ class AnimatedSprite:
         self.current_anim = default
         self.frame_index = 0
         self.timer = 0.0
+        # The current animation's frames/duration, cached for the per-frame
+        # update() and image reads; refreshed by set_animation()
+        self._frames, self._duration = animations[default]
+        self._nframes = len(self._frames)
 
     def set_animation(self, name):
         if name != self.current_anim and name in self.animations:
             self.current_anim = name
             self.frame_index = 0
             self.timer = 0.0
+            self._frames, self._duration = self.animations[name]
+            self._nframes = len(self._frames)
 
     def update(self, dt):
-        frames, duration = self.animations[self.current_anim]
-        self.timer += dt
-        if self.timer >= duration:
-            self.timer -= duration
-            self.frame_index = (self.frame_index + 1) % len(frames)
+        timer = self.timer + dt
+        if timer < self._duration:
+            self.timer = timer
+            return
+        # Advance by every frame boundary crossed, so a long dt doesn't leave
+        # the animation lagging and the leftover timer stays below duration
+        steps = int(timer // self._duration)
+        self.timer = timer - steps * self._duration
+        self.frame_index = (self.frame_index + steps) % self._nframes
 
     @property
     def image(self):
-        frames, _ = self.animations[self.current_anim]
-        return frames[self.frame_index % len(frames)]
+        # frame_index is kept in range by update() and set_animation()
+        return self._frames[self.frame_index]
+
+
+def _convert_frames(animations):
+    """Convert generated frames to the display's pixel format for faster blits.
+
+    Frames shared between animations stay shared. Returns *animations*
+    unchanged if the display mode isn't set yet.
+    """
+    if pygame.display.get_surface() is None:
+        return animations
+    converted = {}
+    result = {}
+    for name, (frames, duration) in animations.items():
+        new_frames = []
+        for frame in frames:
+            fast = converted.get(id(frame))
+            if fast is None:
+                fast = converted[id(frame)] = frame.convert_alpha()
+            new_frames.append(fast)
+        result[name] = (new_frames, duration)
+    return result
 
 
 def create_placeholder_player():
@@ -104,7 +155,7 @@ def create_placeholder_player():
         # Idle animation: just the middle frame, slow "breathing"
         animations[f"idle_{direction}"] = ([frames[1]], 0.5)
 
-    return AnimatedSprite(animations, default="idle_down")
+    return AnimatedSprite(_convert_frames(animations), default="idle_down")
 
 
 def create_placeholder_npc(body_color, facing="down"):
@@ -149,7 +200,7 @@ def create_placeholder_npc(body_color, facing="down"):
 
         animations[f"idle_{direction}"] = ([surf], 0.5)
 
-    return AnimatedSprite(animations, default=f"idle_{facing}")
+    return AnimatedSprite(_convert_frames(animations), default=f"idle_{facing}")
 
 
 def create_placeholder_robot(body_color, facing="down"):
@@ -211,7 +262,7 @@ def create_placeholder_robot(body_color, facing="down"):
 
         animations[f"idle_{direction}"] = ([surf], 0.5)
 
-    return AnimatedSprite(animations, default=f"idle_{facing}")
+    return AnimatedSprite(_convert_frames(animations), default=f"idle_{facing}")
 
 
 def create_placeholder_enemy(body_color):
@@ -257,7 +308,7 @@ def create_placeholder_enemy(body_color):
     # Use 2 frames for a subtle idle bob animation
     animations["idle_down"] = ([animations.pop("idle_frame_0"), animations.pop("idle_frame_1")], 0.4)
 
-    return AnimatedSprite(animations, default="idle_down")
+    return AnimatedSprite(_convert_frames(animations), default="idle_down")
 
 
 # ---------------------------------------------------------------------------
@@ -2,10 +2,14 @@
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 from bit_flippers.strings import load_strings
 
 
 class AboutScreenState:
+    # Identical for every instance, so built on the first push and shared
+    _overlay = None
+
     def __init__(self, game):
         self.game = game
         self.font = get_font(28)
@@ -14,8 +18,26 @@ class AboutScreenState:
         strings = load_strings()
         self.lines: list[str] = strings.get("about", [])
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self.overlay.fill((10, 8, 20, 240))
+        if AboutScreenState._overlay is None:
+            overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
+            overlay.fill((10, 8, 20, 240))
+            AboutScreenState._overlay = overlay
+
+        # The text never changes while the screen is open: render it once
+        # and keep (surface, position) pairs for draw()
+        total_height = len(self.lines) * 30
+        start_y = SCREEN_HEIGHT // 2 - total_height // 2
+        self._text_blits = []
+        for i, line in enumerate(self.lines):
+            if line:
+                surf = self.font.render(line, True, (220, 220, 220))
+                self._text_blits.append(
+                    (surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, start_y + i * 30))
+                )
+        hint = self.font_hint.render("[ESC / SPACE to return]", True, (100, 100, 100))
+        self._text_blits.append(
+            (hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 40))
+        )
 
     def handle_event(self, event):
         if event.type != pygame.KEYDOWN:
@@ -27,17 +49,6 @@ class AboutScreenState:
         pass
 
     def draw(self, screen):
-        screen.blit(self.overlay, (0, 0))
-
-        # Centered text block
-        total_height = len(self.lines) * 30
-        start_y = SCREEN_HEIGHT // 2 - total_height // 2
-
-        for i, line in enumerate(self.lines):
-            if line:
-                surf = self.font.render(line, True, (220, 220, 220))
-                screen.blit(surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, start_y + i * 30))
-
-        # Hint
-        hint = self.font_hint.render("[ESC / SPACE to return]", True, (100, 100, 100))
-        screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 40))
+        screen.blit(self._overlay, (0, 0))
+        # Centered text block + hint
+        screen.blits(self._text_blits, doreturn=False)
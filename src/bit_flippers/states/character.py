@@ -2,12 +2,12 @@
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 from bit_flippers.player_stats import (
     PlayerStats,
-    STAT_ORDER, STAT_POINT_VALUES, STAT_DESCRIPTIONS, STAT_DISPLAY_NAMES,
+    STAT_ORDER, STAT_ROWS, STAT_DESCRIPTIONS, STAT_DISPLAY_NAMES,
     effective_attack, effective_defense,
 )
-from bit_flippers.items import ITEM_REGISTRY
 from bit_flippers.save import save_game
 
 
@@ -23,7 +23,7 @@ class CharacterScreenState:
         self.font_stat = get_font(28)
         self.font_desc = get_font(22)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((15, 15, 25, 220))
 
     def handle_event(self, event):
@@ -44,8 +44,7 @@ class CharacterScreenState:
     def _allocate_point(self):
         if self.stats.unspent_points <= 0:
             return
-        stat_key = STAT_ORDER[self.cursor]
-        increment = STAT_POINT_VALUES[stat_key]
+        stat_key, _name, increment = STAT_ROWS[self.cursor]
         old_val = getattr(self.stats, stat_key)
         setattr(self.stats, stat_key, old_val + increment)
         self.stats.unspent_points -= 1
@@ -89,11 +88,9 @@ class CharacterScreenState:
         list_y = 115
         row_height = 28
 
-        for i, stat_key in enumerate(STAT_ORDER):
+        for i, (stat_key, display_name, increment) in enumerate(STAT_ROWS):
             is_selected = i == self.cursor
             value = getattr(self.stats, stat_key)
-            display_name = STAT_DISPLAY_NAMES[stat_key]
-            increment = STAT_POINT_VALUES[stat_key]
 
             # Highlight color
             if is_selected:
@@ -139,7 +136,7 @@ class CharacterScreenState:
         for slot_key, slot_label in slot_names.items():
             equipped_name = equipment.slots.get(slot_key) if equipment else None
             if equipped_name:
-                item = ITEM_REGISTRY.get(equipped_name)
+                item = equipment.get_item(slot_key)
                 bonus_str = ""
                 if item and item.stat_bonuses:
                     parts = [f"{STAT_DISPLAY_NAMES.get(k, k)}+{v}" for k, v in item.stat_bonuses.items()]
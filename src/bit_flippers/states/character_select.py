@@ -43,6 +43,8 @@ def _load_preview(sprite_key):
 
 
 class CharacterSelectState:
+    opaque = True  # draw() paints every pixel, so Game skips what is beneath
+
     def __init__(self, game, on_select):
         self.game = game
         self.on_select = on_select
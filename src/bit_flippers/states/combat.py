@@ -11,7 +11,7 @@ from bit_flippers.particles import (
     get_shake_intensity, SKILL_PARTICLES,
 )
 from bit_flippers.status_effects import StatusEffectManager
-from bit_flippers.states.combat_renderer import CombatRenderer
+from bit_flippers.states.combat_renderer import BAR_FONT_SIZE, CombatRenderer
 from bit_flippers.combat_actions import (
     resolve_attack, resolve_skill, resolve_item,
     resolve_enemy_turn, resolve_flee,
@@ -33,6 +33,9 @@ MENU_OPTIONS = ["Attack", "Defend", "Skill", "Item", "Flee"]
 
 
 class CombatState:
+    opaque = True  # draw() paints every pixel, so Game skips what is beneath
+    interpolated = True  # particles move every step; Game passes draw() alpha
+
     def __init__(self, game, enemy_data, overworld, inventory=None, player_skills=None):
         self.game = game
         self.overworld = overworld  # reference to overworld for HP sync
@@ -114,7 +117,7 @@ class CombatState:
         # Fonts
         self.font = get_font(28)
         self.font_big = get_font(36)
-        self.font_small = get_font(22)
+        self.font_small = get_font(BAR_FONT_SIZE)
 
         # Layout positions — sprites in upper third, leaving room for 5-item menu
         self.player_pos = (SCREEN_WIDTH // 4 - TILE_SIZE, SCREEN_HEIGHT // 3)
@@ -386,14 +389,14 @@ class CombatState:
         preset = SKILL_PARTICLES.get(skill_id)
         if not preset:
             return
-        target = preset.get("target", "enemy")
+        target = preset.target
         if target == "enemy":
             cx = self.enemy_pos[0] + TILE_SIZE // 2
             cy = self.enemy_pos[1] + TILE_SIZE // 2
         else:
             cx = self.player_pos[0] + TILE_SIZE // 2
             cy = self.player_pos[1] + TILE_SIZE // 2
-        if preset.get("pattern") == "converge":
+        if preset.pattern == "converge":
             self.particles.extend(spawn_particles(
                 self.enemy_pos[0] + TILE_SIZE // 2,
                 self.enemy_pos[1] + TILE_SIZE // 2,
@@ -534,5 +537,5 @@ class CombatState:
                 else:
                     self.phase = Phase.CHOOSING
 
-    def draw(self, screen):
-        self.renderer.draw(screen, self)
+    def draw(self, screen, alpha=1.0):
+        self.renderer.draw(screen, self, alpha)
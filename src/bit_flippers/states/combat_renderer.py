@@ -2,9 +2,10 @@
 
 import pygame
 from bit_flippers.settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, COLOR_SP_BAR,
+    SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, SIM_DT, COLOR_SP_BAR,
     COLOR_STATUS_POISON, COLOR_STATUS_STUN, COLOR_STATUS_BURN, COLOR_STATUS_DESPONDENT,
 )
+from bit_flippers.fonts import render_text
 from bit_flippers.skills import SKILL_DEFS
 from bit_flippers.particles import draw_particles, shake_offset
 
@@ -17,6 +18,9 @@ STATUS_COLORS = {
     "Despondent": COLOR_STATUS_DESPONDENT,
 }
 
+# Small font size, shared with CombatState; bar labels go through the text cache
+BAR_FONT_SIZE = 22
+
 
 class CombatRenderer:
     """Handles all drawing for the combat screen."""
@@ -26,8 +30,11 @@ class CombatRenderer:
         self.font_big = font_big
         self.font_small = font_small
 
-    def draw(self, screen, combat):
-        """Draw the full combat screen."""
+    def draw(self, screen, combat, alpha=1.0):
+        """Draw the full combat screen.
+
+        *alpha* is the position between simulation steps (see Game.draw).
+        """
         from bit_flippers.states.combat import Phase, MENU_OPTIONS
 
         screen.fill((15, 10, 25))
@@ -44,7 +51,7 @@ class CombatRenderer:
         self._draw_combatant(screen, combat.enemy, (combat.enemy_pos[0] + sx, combat.enemy_pos[1] + sy), "enemy", combat)
 
         # Draw particles (after combatants, before UI)
-        draw_particles(screen, combat.particles)
+        draw_particles(screen, combat.particles, (1.0 - alpha) * SIM_DT)
 
         # HP bars
         hp_bar_y = combat.player_pos[1] - TILE_SIZE - 16
@@ -151,9 +158,9 @@ class CombatRenderer:
         pygame.draw.rect(screen, color, (x, y, int(width * ratio), bar_height))
         pygame.draw.rect(screen, (180, 180, 180), (x, y, width, bar_height), 1)
 
-        hp_text = self.font_small.render(f"{entity.hp}/{entity.max_hp}", True, (255, 255, 255))
+        hp_text = render_text(BAR_FONT_SIZE, f"{entity.hp}/{entity.max_hp}", (255, 255, 255))
         screen.blit(hp_text, (x, y - 16))
-        name_text = self.font_small.render(entity.name, True, (255, 255, 255))
+        name_text = render_text(BAR_FONT_SIZE, entity.name, (255, 255, 255))
         screen.blit(name_text, (x, y - 32))
 
     def _draw_sp_bar(self, screen, x, y, width, player_stats, eq_max_sp_bonus):
@@ -163,7 +170,7 @@ class CombatRenderer:
         pygame.draw.rect(screen, (40, 40, 40), (x, y, width, bar_height))
         pygame.draw.rect(screen, COLOR_SP_BAR, (x, y, int(width * ratio), bar_height))
         pygame.draw.rect(screen, (140, 140, 140), (x, y, width, bar_height), 1)
-        sp_text = self.font_small.render(f"SP {player_stats.current_sp}/{combat_max_sp}", True, (180, 200, 255))
+        sp_text = render_text(BAR_FONT_SIZE, f"SP {player_stats.current_sp}/{combat_max_sp}", (180, 200, 255))
         screen.blit(sp_text, (x + width + 4, y - 2))
 
     def _draw_menu(self, screen, menu_index):
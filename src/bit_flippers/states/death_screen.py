@@ -2,6 +2,7 @@
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 from bit_flippers.save import save_game
 
 
@@ -15,7 +16,7 @@ class DeathScreenState:
         self.font_info = get_font(28)
         self.font_prompt = get_font(24)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((60, 10, 10, 220))
 
     def handle_event(self, event):
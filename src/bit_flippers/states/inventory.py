@@ -6,6 +6,7 @@ from bit_flippers.settings import (
     COLOR_INVENTORY_BG,
     COLOR_ITEM_HIGHLIGHT,
 )
+from bit_flippers.sprites import make_surface
 from bit_flippers.items import ITEM_REGISTRY
 
 
@@ -33,7 +34,7 @@ class InventoryState:
         self.font_desc = get_font(22)
         self.font_tag = get_font(20)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill(COLOR_INVENTORY_BG)
 
     def _get_item_list(self):
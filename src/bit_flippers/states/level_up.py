@@ -3,7 +3,8 @@ import math
 
 import pygame
 from bit_flippers.fonts import get_font
-from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_DT
+from bit_flippers.sprites import make_surface
 from bit_flippers.particles import spawn_particles, update_particles, draw_particles
 
 
@@ -11,23 +12,24 @@ from bit_flippers.particles import spawn_particles, update_particles, draw_parti
 _LEVEL_UP_PRESET = "level_up"
 
 # Register it dynamically so particles.py stays generic
-from bit_flippers.particles import SKILL_PARTICLES
-SKILL_PARTICLES[_LEVEL_UP_PRESET] = {
-    "color": (255, 220, 80),
-    "pattern": "burst",
-    "count": 30,
-    "speed": 120,
-    "lifetime": 1.2,
-    "size": 3.5,
-    "target": "player",
-    "shake": 0,
-}
+from bit_flippers.particles import SKILL_PARTICLES, ParticlePreset
+SKILL_PARTICLES[_LEVEL_UP_PRESET] = ParticlePreset(
+    color=(255, 220, 80),
+    pattern="burst",
+    count=30,
+    speed=120,
+    lifetime=1.2,
+    size=3.5,
+    target="player",
+    shake=0,
+)
 
 
 class LevelUpState:
     """Semi-transparent celebration overlay for leveling up."""
 
     AUTO_DISMISS = 2.0  # seconds before auto-dismiss
+    interpolated = True  # particles move every step; Game passes draw() alpha
 
     def __init__(self, game, new_level, stat_points, skill_points):
         self.game = game
@@ -40,7 +42,7 @@ class LevelUpState:
         self.font_med = get_font(28)
         self.font_hint = get_font(22)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((10, 10, 30, 180))
 
         # Spawn gold particle burst at center
@@ -62,11 +64,11 @@ class LevelUpState:
         if self.timer >= self.AUTO_DISMISS:
             self.game.pop_state()
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         screen.blit(self.overlay, (0, 0))
 
         # Draw particles behind text
-        draw_particles(screen, self.particles)
+        draw_particles(screen, self.particles, (1.0 - alpha) * SIM_DT)
 
         cx = SCREEN_WIDTH // 2
 
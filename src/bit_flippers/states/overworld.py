@@ -11,6 +11,7 @@ from bit_flippers.settings import (
     SCRAP_BONUS_ITEMS,
     PICKUP_MESSAGE_DURATION,
     BASE_XP,
+    COLOR_BLACK,
 )
 from bit_flippers.camera import Camera
 from bit_flippers.minimap import Minimap
@@ -21,7 +22,7 @@ from bit_flippers.maps import MAP_REGISTRY, MapPersistence
 from bit_flippers.player_stats import PlayerStats, points_for_level
 from bit_flippers.save import save_game
 from bit_flippers.strings import get_npc_dialogue
-from bit_flippers.states.overworld_hud import draw_hud, draw_icon_markers
+from bit_flippers.states.overworld_hud import HUD_FONT_SIZE, draw_hud, draw_icon_markers
 from bit_flippers.events import EventManager
 from bit_flippers.encounter import EncounterManager
 from bit_flippers.interaction import resolve_npc_interaction
@@ -37,11 +38,34 @@ DIRECTION_MAP = {
     pygame.K_RIGHT: (1,  0, "right"),
 }
 
+# Per-facing lookups built once, so the per-frame paths don't branch on or
+# format direction strings
+_FACING_DELTA = {facing: (dx, dy) for dx, dy, facing in DIRECTION_MAP.values()}
+_WALK_ANIM = {facing: f"walk_{facing}" for facing in _FACING_DELTA}
+_IDLE_ANIM = {facing: f"idle_{facing}" for facing in _FACING_DELTA}
+
 
 _DEFAULT_SPRITE_KEY = "pipoya-characters/Male/Male 01-1"
 
 
+def _scrap_from_save(coords, version):
+    """Rebuild a collected-scrap set from its saved form.
+
+    Save format 3 stores a flat [x0, y0, x1, y1, ...] list; earlier versions
+    used [[x, y], ...].
+    """
+    if version >= 3:
+        return set(zip(coords[::2], coords[1::2]))
+    return {tuple(c) for c in coords}
+
+
 class OverworldState:
+    # The map, the margin fills and the HUD together cover every pixel
+    opaque = True
+    # The player walk tween and the camera move every step; Game passes draw()
+    # the interpolation alpha
+    interpolated = True
+
     def __init__(self, game, save_data=None, sprite_key=None):
         self.game = game
 
@@ -53,7 +77,7 @@ class OverworldState:
         self._current_scripted_enemy = None
 
         # HUD font
-        self.hud_font = get_font(22)
+        self.hud_font = get_font(HUD_FONT_SIZE)
 
         # Player sprite key — set before _fresh_start / _restore_from_save
         self.player_sprite_key = sprite_key or _DEFAULT_SPRITE_KEY
@@ -76,8 +100,13 @@ class OverworldState:
 
         # TMX-first resolved map data (set by _load_map)
         self._current_doors = []
+        # Tile -> entity lookups for the loaded map; placements never move
+        self._doors_by_pos = {}
+        self._npcs_by_pos = {}
+        self._enemy_npcs_by_pos = {}
         self._all_scrap_positions = []
         self._current_icon_markers = []
+        self._viewport_margins = []
         self._current_music_track = "overworld"
         self._current_display_name = ""
 
@@ -162,9 +191,10 @@ class OverworldState:
 
         # Map persistence
         self.map_persistence: dict[str, MapPersistence] = {}
+        version = save_data.get("version", 1)
         for map_id, pdata in save_data.get("map_persistence", {}).items():
             mp = MapPersistence()
-            mp.collected_scrap = {tuple(c) for c in pdata.get("collected_scrap", [])}
+            mp.collected_scrap = _scrap_from_save(pdata.get("collected_scrap", []), version)
             mp.defeated_enemies = set(pdata.get("defeated_enemies", []))
             mp.triggered_events = {tuple(t) for t in pdata.get("triggered_events", [])}
             self.map_persistence[map_id] = mp
@@ -223,6 +253,9 @@ class OverworldState:
         npc_defs = tmx_npcs if tmx_npcs else map_def.npcs
         enemy_defs = tmx_enemies if tmx_enemies else map_def.enemies
         self._current_doors = tmx_doors if tmx_doors else map_def.doors
+        self._doors_by_pos = {}
+        for door in self._current_doors:
+            self._doors_by_pos.setdefault((door.x, door.y), door)
         scrap_positions = tmx_scrap if tmx_scrap else list(map_def.scrap_positions)
         self._all_scrap_positions = scrap_positions
         self._current_icon_markers = tmx_icons if tmx_icons else map_def.icon_markers
@@ -249,6 +282,15 @@ class OverworldState:
         self.scrap_remaining = set(scrap_positions) - persist.collected_scrap
 
         self.camera = Camera(SCREEN_WIDTH, VIEWPORT_HEIGHT)
+        # Viewport strips a small map doesn't reach; cleared instead of the
+        # whole screen each frame
+        map_w, map_h = self.tiled_renderer.width_px, self.tiled_renderer.height_px
+        self._viewport_margins = []
+        if map_w < SCREEN_WIDTH:
+            self._viewport_margins.append((map_w, 0, SCREEN_WIDTH - map_w, VIEWPORT_HEIGHT))
+        if map_h < VIEWPORT_HEIGHT:
+            self._viewport_margins.append((0, map_h, min(map_w, SCREEN_WIDTH), VIEWPORT_HEIGHT - map_h))
+        self.camera.set_bounds(self.tiled_renderer.width_px, self.tiled_renderer.height_px)
         self.minimap = Minimap(self.tiled_renderer, width=100, height=80)
 
         # Set player position — TMX spawn when no explicit coords provided
@@ -268,6 +310,7 @@ class OverworldState:
         self.player_y = py
         self.player_visual_x = float(px * TILE_SIZE)
         self.player_visual_y = float(py * TILE_SIZE)
+        self._prev_visual = (self.player_visual_x, self.player_visual_y)
         if spawn_facing:
             self.player_facing = spawn_facing
 
@@ -283,6 +326,9 @@ class OverworldState:
                     sprite_style=getattr(npc_def, "sprite_style", "humanoid"),
                 )
             )
+        self._npcs_by_pos = {}
+        for npc in self.npcs:
+            self._npcs_by_pos.setdefault((npc.tile_x, npc.tile_y), npc)
 
         # Build enemy NPC list
         from bit_flippers.combat import ENEMY_TYPES
@@ -297,6 +343,11 @@ class OverworldState:
                 "sprite": create_placeholder_enemy(edef.color),
                 "defeated": defeated,
             })
+        self._enemy_npcs_by_pos = {}
+        for enemy_npc in self.enemy_npcs:
+            self._enemy_npcs_by_pos.setdefault(
+                (enemy_npc["tile_x"], enemy_npc["tile_y"]), []
+            ).append(enemy_npc)
 
         # Load tile events and restore triggered state from persistence
         self.event_manager = EventManager()
@@ -311,20 +362,20 @@ class OverworldState:
 
     def _handle_door_transition(self):
         """Check if the player is standing on a door and transition if so."""
-        for door in self._current_doors:
-            if door.x == self.player_x and door.y == self.player_y:
-                from bit_flippers.states.transition import FadeTransition
+        door = self._doors_by_pos.get((self.player_x, self.player_y))
+        if door is None:
+            return
+        from bit_flippers.states.transition import FadeTransition
 
-                target_map = door.target_map_id
-                sx, sy = door.target_spawn_x, door.target_spawn_y
-                sf = door.target_facing
+        target_map = door.target_map_id
+        sx, sy = door.target_spawn_x, door.target_spawn_y
+        sf = door.target_facing
 
-                def _do_load(_ow=self, _mid=target_map, _sx=sx, _sy=sy, _sf=sf):
-                    _ow._load_map(_mid, spawn_x=_sx, spawn_y=_sy, spawn_facing=_sf)
-                    _ow.player_quests.update_visit(_mid)
+        def _do_load(_ow=self, _mid=target_map, _sx=sx, _sy=sy, _sf=sf):
+            _ow._load_map(_mid, spawn_x=_sx, spawn_y=_sy, spawn_facing=_sf)
+            _ow.player_quests.update_visit(_mid)
 
-                self.game.push_state(FadeTransition(self.game, _do_load))
-                return
+        self.game.push_state(FadeTransition(self.game, _do_load))
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -362,15 +413,7 @@ class OverworldState:
 
     def _try_interact(self):
         """Check the tile the player is facing and interact if an NPC is there."""
-        dx, dy = 0, 0
-        if self.player_facing == "up":
-            dy = -1
-        elif self.player_facing == "down":
-            dy = 1
-        elif self.player_facing == "left":
-            dx = -1
-        elif self.player_facing == "right":
-            dx = 1
+        dx, dy = _FACING_DELTA.get(self.player_facing, (0, 0))
 
         target_x = self.player_x + dx
         target_y = self.player_y + dy
@@ -382,20 +425,15 @@ class OverworldState:
             return
 
         # Check friendly NPCs
-        for npc in self.npcs:
-            if npc.tile_x == target_x and npc.tile_y == target_y:
-                self._interact_with_npc(npc)
-                return
+        npc = self._npcs_by_pos.get((target_x, target_y))
+        if npc is not None:
+            self._interact_with_npc(npc)
+            return
 
         # Check enemy NPCs
-        for enemy_npc in self.enemy_npcs:
-            if (
-                not enemy_npc["defeated"]
-                and enemy_npc["tile_x"] == target_x
-                and enemy_npc["tile_y"] == target_y
-            ):
-                self._start_scripted_combat(enemy_npc)
-                return
+        enemy_npc = self._live_enemy_npc_at(target_x, target_y)
+        if enemy_npc is not None:
+            self._start_scripted_combat(enemy_npc)
 
     def _interact_with_npc(self, npc):
         """Resolve an NPC interaction via InteractionHandler and push states."""
@@ -578,10 +616,7 @@ class OverworldState:
             self.pickup_message_timer = PICKUP_MESSAGE_DURATION
 
         elif action.action_type == "toggle_walkable":
-            tx, ty = action.target_x, action.target_y
-            if 0 <= tx < self.tiled_renderer.width_tiles and 0 <= ty < self.tiled_renderer.height_tiles:
-                current = self.tiled_renderer._walkable[ty][tx]
-                self.tiled_renderer._walkable[ty][tx] = not current
+            self.tiled_renderer.toggle_walkable(action.target_x, action.target_y)
             self.pickup_message = action.message
             self.pickup_message_timer = PICKUP_MESSAGE_DURATION
 
@@ -590,6 +625,7 @@ class OverworldState:
             self.player_y = action.target_y
             self.player_visual_x = float(action.target_x * TILE_SIZE)
             self.player_visual_y = float(action.target_y * TILE_SIZE)
+            self._prev_visual = (self.player_visual_x, self.player_visual_y)
 
         elif action.action_type == "start_combat":
             from bit_flippers.combat import ENEMY_TYPES
@@ -618,13 +654,14 @@ class OverworldState:
 
     def _npc_at(self, tx, ty):
         """Check if any NPC (friendly or enemy) occupies the given tile."""
-        for npc in self.npcs:
-            if npc.tile_x == tx and npc.tile_y == ty:
-                return True
-        for enemy_npc in self.enemy_npcs:
-            if not enemy_npc["defeated"] and enemy_npc["tile_x"] == tx and enemy_npc["tile_y"] == ty:
-                return True
-        return False
+        return (tx, ty) in self._npcs_by_pos or self._live_enemy_npc_at(tx, ty) is not None
+
+    def _live_enemy_npc_at(self, tx, ty):
+        """Return the first undefeated enemy NPC on the given tile, or None."""
+        for enemy_npc in self._enemy_npcs_by_pos.get((tx, ty), ()):
+            if not enemy_npc["defeated"]:
+                return enemy_npc
+        return None
 
     def _door_is_open(self, door):
         """Check whether a quest-gated door is unlocked."""
@@ -647,22 +684,24 @@ class OverworldState:
             self.player_x = new_x
             self.player_y = new_y
 
+            pos = (new_x, new_y)
+
             # Check for door transition
-            for door in self._current_doors:
-                if door.x == new_x and door.y == new_y:
-                    if not self._door_is_open(door):
-                        # Undo the move and show locked message
-                        self.player_x -= dx
-                        self.player_y -= dy
-                        self.pickup_message = door.locked_message
-                        self.pickup_message_timer = PICKUP_MESSAGE_DURATION
-                        return
-                    self._handle_door_transition()
+            door = self._doors_by_pos.get(pos)
+            if door is not None:
+                if not self._door_is_open(door):
+                    # Undo the move and show locked message
+                    self.player_x -= dx
+                    self.player_y -= dy
+                    self.pickup_message = door.locked_message
+                    self.pickup_message_timer = PICKUP_MESSAGE_DURATION
                     return
+                self._handle_door_transition()
+                return
 
             # Scrap pickup
-            if (new_x, new_y) in self.scrap_remaining:
-                self.scrap_remaining.discard((new_x, new_y))
+            if pos in self.scrap_remaining:
+                self.scrap_remaining.remove(pos)
                 self.inventory.add("Scrap Metal")
                 self.stats.money += 1
                 self.game.audio.play_sfx("pickup")
@@ -711,7 +750,9 @@ class OverworldState:
                 self._try_move(self.held_direction)
                 self.move_timer -= MOVE_COOLDOWN
 
-        # Smooth visual interpolation toward logical position
+        # Smooth visual interpolation toward logical position; the position
+        # before this step is kept for draw() to interpolate from
+        self._prev_visual = (self.player_visual_x, self.player_visual_y)
         target_x = float(self.player_x * TILE_SIZE)
         target_y = float(self.player_y * TILE_SIZE)
         max_step = PLAYER_MOVE_SPEED * dt
@@ -731,10 +772,8 @@ class OverworldState:
 
         # Update sprite animation
         moving = abs(self.player_visual_x - target_x) > 0.5 or abs(self.player_visual_y - target_y) > 0.5
-        if moving:
-            self.sprite.set_animation(f"walk_{self.player_facing}")
-        else:
-            self.sprite.set_animation(f"idle_{self.player_facing}")
+        anims = _WALK_ANIM if moving else _IDLE_ANIM
+        self.sprite.set_animation(anims.get(self.player_facing))
         self.sprite.update(dt)
 
         # Update NPC animations
@@ -744,49 +783,38 @@ class OverworldState:
             if not enemy_npc["defeated"]:
                 enemy_npc["sprite"].update(dt)
 
-        # Update camera to follow player visual position (center of sprite)
-        map_source = self.tiled_renderer
-        self.camera.update(
-            int(self.player_visual_x) + TILE_SIZE // 2,
-            int(self.player_visual_y) + TILE_SIZE // 2,
-            map_source.width_px,
-            map_source.height_px,
-        )
+    def draw(self, screen, alpha=1.0):
+        # Player drawn between its last two simulated positions; the camera
+        # follows that drawn position (center of sprite)
+        prev_x, prev_y = self._prev_visual
+        player_x = int(prev_x + (self.player_visual_x - prev_x) * alpha)
+        player_y = int(prev_y + (self.player_visual_y - prev_y) * alpha)
+        self.camera.update(player_x + TILE_SIZE // 2, player_y + TILE_SIZE // 2)
 
-    def draw(self, screen):
         # Clip game world to the viewport area (top 360px)
         viewport_rect = pygame.Rect(0, 0, SCREEN_WIDTH, VIEWPORT_HEIGHT)
         screen.set_clip(viewport_rect)
+        for margin in self._viewport_margins:
+            screen.fill(COLOR_BLACK, margin)
 
         # Draw map tiles (below sprites)
         self.tiled_renderer.draw_below(screen, self.camera)
         draw_icon_markers(screen, self._current_icon_markers, self.camera)
 
         # Draw friendly NPCs
+        camera = self.camera
         for npc in self.npcs:
-            npc_rect = pygame.Rect(
-                npc.tile_x * TILE_SIZE, npc.tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE
-            )
-            screen_rect = self.camera.apply(npc_rect)
-            screen.blit(npc.image, screen_rect)
+            screen.blit(npc.image, camera.apply_pos(npc.tile_x * TILE_SIZE, npc.tile_y * TILE_SIZE))
 
         # Draw enemy NPCs
         for enemy_npc in self.enemy_npcs:
             if not enemy_npc["defeated"]:
-                npc_rect = pygame.Rect(
-                    enemy_npc["tile_x"] * TILE_SIZE,
-                    enemy_npc["tile_y"] * TILE_SIZE,
-                    TILE_SIZE, TILE_SIZE,
-                )
-                screen_rect = self.camera.apply(npc_rect)
-                screen.blit(enemy_npc["sprite"].image, screen_rect)
+                screen.blit(enemy_npc["sprite"].image, camera.apply_pos(
+                    enemy_npc["tile_x"] * TILE_SIZE, enemy_npc["tile_y"] * TILE_SIZE,
+                ))
 
         # Draw player sprite at visual position
-        player_rect = pygame.Rect(
-            int(self.player_visual_x), int(self.player_visual_y), TILE_SIZE, TILE_SIZE
-        )
-        screen_rect = self.camera.apply(player_rect)
-        screen.blit(self.sprite.image, screen_rect)
+        screen.blit(self.sprite.image, camera.apply_pos(player_x, player_y))
 
         # Draw map tiles (above sprites) for Tiled maps
         if self.tiled_renderer:
@@ -815,5 +843,5 @@ class OverworldState:
         draw_hud(
             screen, self.stats, self.player_skills, self.player_quests,
             self.xp_to_next_level(), self._current_display_name,
-            self.minimap, self.minimap_visible, self.hud_font,
+            self.minimap, self.minimap_visible,
         )
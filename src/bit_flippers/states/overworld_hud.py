@@ -1,6 +1,7 @@
 """Overworld HUD rendering — extracted from OverworldState for clarity."""
 
 import pygame
+from bit_flippers.fonts import render_text
 from bit_flippers.settings import (
     SCREEN_WIDTH,
     HUD_HEIGHT,
@@ -13,6 +14,8 @@ from bit_flippers.settings import (
     COLOR_MONEY_TEXT,
 )
 
+HUD_FONT_SIZE = 22
+
 
 def draw_icon_markers(screen, markers, camera):
     """Draw branding icons on wall tiles adjacent to shop doors."""
@@ -36,7 +39,7 @@ def draw_icon_markers(screen, markers, camera):
 
 
 def draw_hud(screen, stats, player_skills, player_quests, xp_to_next,
-             display_name, minimap, minimap_visible, hud_font):
+             display_name, minimap, minimap_visible):
     """Draw the full 3-column HUD panel in the bottom 120px."""
     # Background panel
     pygame.draw.rect(screen, COLOR_HUD_BG, (0, HUD_Y, SCREEN_WIDTH, HUD_HEIGHT))
@@ -50,73 +53,73 @@ def draw_hud(screen, stats, player_skills, player_quests, xp_to_next,
 
     # --- LEFT COLUMN: Level + HP/SP/XP bars ---
     y = HUD_Y + pad
-    level_label = hud_font.render(f"Lv {stats.level}", True, (255, 255, 255))
+    level_label = render_text(HUD_FONT_SIZE, f"Lv {stats.level}", (255, 255, 255))
     screen.blit(level_label, (col_left, y))
     y += 20
 
     bar_x = col_left + 28
     # HP bar
     hp_ratio = stats.current_hp / stats.max_hp if stats.max_hp > 0 else 0
-    hp_label = hud_font.render("HP", True, (255, 255, 255))
+    hp_label = render_text(HUD_FONT_SIZE, "HP", (255, 255, 255))
     screen.blit(hp_label, (col_left, y))
     pygame.draw.rect(screen, (60, 60, 60), (bar_x, y + 2, bar_width, bar_height))
     hp_color = (80, 200, 80) if hp_ratio > 0.5 else (200, 200, 40) if hp_ratio > 0.25 else (200, 60, 60)
     pygame.draw.rect(screen, hp_color, (bar_x, y + 2, int(bar_width * hp_ratio), bar_height))
     pygame.draw.rect(screen, (180, 180, 180), (bar_x, y + 2, bar_width, bar_height), 1)
-    hp_text = hud_font.render(f"{stats.current_hp}/{stats.max_hp}", True, (255, 255, 255))
+    hp_text = render_text(HUD_FONT_SIZE, f"{stats.current_hp}/{stats.max_hp}", (255, 255, 255))
     screen.blit(hp_text, (bar_x + bar_width + 6, y + 1))
     y += 20
 
     # SP bar
     sp_ratio = stats.current_sp / stats.max_sp if stats.max_sp > 0 else 0
-    sp_label = hud_font.render("SP", True, (255, 255, 255))
+    sp_label = render_text(HUD_FONT_SIZE, "SP", (255, 255, 255))
     screen.blit(sp_label, (col_left, y))
     pygame.draw.rect(screen, (40, 40, 40), (bar_x, y + 2, bar_width, bar_height))
     pygame.draw.rect(screen, COLOR_SP_BAR, (bar_x, y + 2, int(bar_width * sp_ratio), bar_height))
     pygame.draw.rect(screen, (140, 140, 140), (bar_x, y + 2, bar_width, bar_height), 1)
-    sp_text = hud_font.render(f"{stats.current_sp}/{stats.max_sp}", True, (255, 255, 255))
+    sp_text = render_text(HUD_FONT_SIZE, f"{stats.current_sp}/{stats.max_sp}", (255, 255, 255))
     screen.blit(sp_text, (bar_x + bar_width + 6, y + 1))
     y += 20
 
     # XP bar
-    xp_label = hud_font.render("XP", True, (255, 255, 255))
+    xp_label = render_text(HUD_FONT_SIZE, "XP", (255, 255, 255))
     screen.blit(xp_label, (col_left, y))
     xp_needed = xp_to_next
     xp_ratio = stats.xp / xp_needed if xp_needed > 0 else 0
     pygame.draw.rect(screen, (60, 60, 60), (bar_x, y + 2, bar_width, bar_height))
     pygame.draw.rect(screen, COLOR_XP_BAR, (bar_x, y + 2, int(bar_width * xp_ratio), bar_height))
     pygame.draw.rect(screen, (180, 180, 180), (bar_x, y + 2, bar_width, bar_height), 1)
-    xp_text = hud_font.render(f"{stats.xp}/{xp_needed}", True, (255, 255, 255))
+    xp_text = render_text(HUD_FONT_SIZE, f"{stats.xp}/{xp_needed}", (255, 255, 255))
     screen.blit(xp_text, (bar_x + bar_width + 6, y + 1))
 
     # --- CENTER COLUMN: Money + map name ---
     y = HUD_Y + pad
-    money_label = hud_font.render(f"Scrap: {stats.money}", True, COLOR_MONEY_TEXT)
+    money_label = render_text(HUD_FONT_SIZE, f"Scrap: {stats.money}", COLOR_MONEY_TEXT)
     screen.blit(money_label, (col_mid, y))
     y += 20
 
     if display_name:
-        map_label = hud_font.render(display_name, True, (200, 200, 200))
+        map_label = render_text(HUD_FONT_SIZE, display_name, (200, 200, 200))
         screen.blit(map_label, (col_mid, y))
 
     # --- RIGHT COLUMN: Conditional notifications ---
     y = HUD_Y + pad
     if stats.unspent_points > 0:
-        pts_label = hud_font.render(
-            f"+{stats.unspent_points} pts [C]", True, (255, 220, 100)
+        pts_label = render_text(
+            HUD_FONT_SIZE, f"+{stats.unspent_points} pts [C]", (255, 220, 100)
         )
         screen.blit(pts_label, (col_right, y))
         y += 20
 
     if player_skills.skill_points > 0:
-        skill_label = hud_font.render(
-            f"+{player_skills.skill_points} skill pts [K]", True, (100, 180, 255)
+        skill_label = render_text(
+            HUD_FONT_SIZE, f"+{player_skills.skill_points} skill pts [K]", (100, 180, 255)
         )
         screen.blit(skill_label, (col_right, y))
         y += 20
 
     if player_quests.has_completable():
-        quest_label = hud_font.render("! Quest ready [Q]", True, (100, 255, 100))
+        quest_label = render_text(HUD_FONT_SIZE, "! Quest ready [Q]", (100, 255, 100))
         screen.blit(quest_label, (col_right, y))
 
     # Minimap in HUD (far right)
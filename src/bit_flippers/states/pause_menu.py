@@ -2,6 +2,7 @@
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 
 MENU_OPTIONS = ["Resume", "Save Game", "Inventory", "Quest Log", "Character", "Skill Tree", "Options", "Quit Game"]
 
@@ -16,7 +17,7 @@ class PauseMenuState:
         self.font_option = get_font(28)
         self.font_hint = get_font(22)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((10, 10, 20, 200))
 
     def handle_event(self, event):
@@ -8,6 +8,7 @@ from bit_flippers.settings import (
     COLOR_QUEST_COMPLETE,
     COLOR_QUEST_AVAILABLE,
 )
+from bit_flippers.sprites import make_surface
 from bit_flippers.quests import QUEST_REGISTRY
 
 _FILTER_TABS = ["Current", "Completed", "All"]
@@ -32,7 +33,7 @@ class QuestLogState:
         self.font_hint = get_font(20)
         self.font_tab = get_font(24)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((10, 10, 20, 220))
 
         self._rebuild_list()
@@ -4,6 +4,7 @@ import time
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 from bit_flippers.save import get_slot_summary, save_game, load_game, has_save
 
 _NUM_SLOTS = 5
@@ -38,7 +39,7 @@ class SaveMenuState:
         self.font_hint = get_font(22)
 
         # Overlay
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((10, 10, 20, 240))
 
         # Load slot summaries
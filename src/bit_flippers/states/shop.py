@@ -12,6 +12,7 @@ from bit_flippers.settings import (
     COLOR_ITEM_HIGHLIGHT,
     COLOR_MONEY_TEXT,
 )
+from bit_flippers.sprites import make_surface
 from bit_flippers.items import ITEM_REGISTRY, SHOP_STOCK, Equipment
 from bit_flippers.save import save_game
 
@@ -45,11 +46,11 @@ class ShopState:
         self.font_desc = get_font(22)
 
         # Overlay
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill(COLOR_SHOP_BG)
 
         # Confirm overlay
-        self.confirm_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.confirm_overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.confirm_overlay.fill(COLOR_SHOP_CONFIRM_BG)
 
     @property
@@ -2,6 +2,7 @@
 import pygame
 from bit_flippers.fonts import get_font
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 from bit_flippers.skills import SKILL_DEFS, PlayerSkills, _SKILL_LIST
 from bit_flippers.save import save_game
 
@@ -45,7 +46,7 @@ class SkillTreeState:
         self.font_desc = get_font(24)
         self.font_hint = get_font(22)
 
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True)
         self.overlay.fill((10, 10, 20, 230))
 
         self.message = ""
@@ -7,6 +7,8 @@ from bit_flippers.save import has_save
 
 
 class TitleScreenState:
+    opaque = True  # draw() paints every pixel, so Game skips what is beneath
+
     def __init__(self, game):
         self.game = game
         self.cursor = 0
@@ -1,6 +1,7 @@
 """Screen transition states: fade-to-black and combat wipe."""
 import pygame
 from bit_flippers.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from bit_flippers.sprites import make_surface
 
 
 class FadeTransition:
@@ -15,7 +16,7 @@ class FadeTransition:
         self.phase = "out"  # "out" -> "in" -> done
         self.alpha = 0.0
         self.fade_speed = 255 / 0.4  # full fade in 0.4s
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.overlay.fill((0, 0, 0))
         self._callback_done = False
 
@@ -29,6 +30,8 @@ class FadeTransition:
                 if not self._callback_done:
                     self.callback()
                     self._callback_done = True
+                    # The callback usually swaps the map underneath us
+                    self.game.invalidate_layers()
                 self.phase = "in"
         elif self.phase == "in":
             self.alpha = max(0.0, self.alpha - self.fade_speed * dt)
@@ -49,9 +52,9 @@ class CombatTransition:
         self.timer = 0.0
         self._callback_done = False
 
-        self.white_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.white_overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.white_overlay.fill((255, 255, 255))
-        self.black_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.black_overlay = make_surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.black_overlay.fill((0, 0, 0))
 
         # Timing
@@ -11,6 +11,7 @@ import pytmx.util_pygame
 from bit_flippers.settings import TILE_SIZE
 from bit_flippers.maps import NPCDef, EnemyNPCDef, DoorDef, IconMarker
 from bit_flippers.events import TileEvent
+from bit_flippers.sprites import make_surface
 
 _ASSET_DIR = os.path.normpath(
     os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "assets")
@@ -47,30 +48,42 @@ class TiledMapRenderer:
             else:
                 self._below_layers.append(layer_idx)
 
+        # Full-map composites of the layer groups, built on first draw
+        self._below_surface: pygame.Surface | None = None
+        self._above_surface: pygame.Surface | None = None
+
         # Build walkability grid from tile properties or collision objects
         self._walkable = self._build_walkability()
+        # Bumped on every change so caches derived from _walkable can tell
+        self.walkable_version = 0
 
-    def _build_walkability(self) -> list[list[bool]]:
-        """Build a 2D grid of walkability flags.
+    def _build_walkability(self) -> bytearray:
+        """Build a row-major grid of walkability flags, one byte per tile.
 
         A tile is not walkable if:
         - Any tile layer has a tile with property 'walkable' set to False/'false'
         - A collision object layer contains a rectangle covering the tile
         """
-        walkable = [[True] * self.width_tiles for _ in range(self.height_tiles)]
+        w = self.width_tiles
+        walkable = bytearray(b"\x01") * (w * self.height_tiles)
+
+        # Resolve the 'walkable' property once per tile type, so each map
+        # cell costs one set probe instead of a property lookup and compares
+        blocked_gids = frozenset(
+            gid for gid, props in self.tmx_data.tile_properties.items()
+            if props and (
+                (flag := props.get("walkable")) is False or flag == "false" or flag == "False"
+            )
+        )
 
         # Check tile properties on all tile layers
-        for layer in self.tmx_data.layers:
-            if not hasattr(layer, 'data'):
-                continue
-            for x, y, gid in layer:
-                if gid == 0:
+        if blocked_gids:
+            for layer in self.tmx_data.layers:
+                if not hasattr(layer, 'data'):
                     continue
-                props = self.tmx_data.get_tile_properties_by_gid(gid)
-                if props:
-                    w = props.get("walkable")
-                    if w is False or w == "false" or w == "False":
-                        walkable[y][x] = False
+                for x, y, gid in layer:
+                    if gid in blocked_gids:
+                        walkable[y * w + x] = 0
 
         # Check object layers named "collision" or "collisions"
         for obj_group in self.tmx_data.objectgroups:
@@ -81,43 +94,75 @@ class TiledMapRenderer:
                     ty_start = int(obj.y) // self.tile_height
                     tx_end = (int(obj.x) + int(obj.width) - 1) // self.tile_width
                     ty_end = (int(obj.y) + int(obj.height) - 1) // self.tile_height
+                    tx_lo = max(0, tx_start)
+                    tx_hi = min(w, tx_end + 1)
+                    if tx_lo >= tx_hi:
+                        continue
                     for ty in range(max(0, ty_start), min(self.height_tiles, ty_end + 1)):
-                        for tx in range(max(0, tx_start), min(self.width_tiles, tx_end + 1)):
-                            walkable[ty][tx] = False
+                        row = ty * w
+                        walkable[row + tx_lo:row + tx_hi] = bytes(tx_hi - tx_lo)
 
         return walkable
 
     def is_walkable(self, tile_x: int, tile_y: int) -> bool:
         if 0 <= tile_x < self.width_tiles and 0 <= tile_y < self.height_tiles:
-            return self._walkable[tile_y][tile_x]
+            return self._walkable[tile_y * self.width_tiles + tile_x] != 0
         return False
 
-    def _draw_layers(self, screen, camera, layer_indices):
-        """Draw a set of tile layers with viewport culling."""
-        start_col = max(0, camera.x // self.tile_width)
-        end_col = min(self.width_tiles, (camera.x + camera.screen_width) // self.tile_width + 1)
-        start_row = max(0, camera.y // self.tile_height)
-        end_row = min(self.height_tiles, (camera.y + camera.screen_height) // self.tile_height + 1)
+    def walkable_mask(self) -> bytes:
+        """Row-major walkability, one byte per tile (1 = walkable, 0 = blocked)."""
+        return bytes(self._walkable)
+
+    def toggle_walkable(self, tile_x: int, tile_y: int) -> None:
+        """Flip walkability of a tile (no-op outside the map)."""
+        if 0 <= tile_x < self.width_tiles and 0 <= tile_y < self.height_tiles:
+            i = tile_y * self.width_tiles + tile_x
+            self._walkable[i] = 0 if self._walkable[i] else 1
+            self.walkable_version += 1
+
+    def _prerender_layers(self, layer_indices, alpha: bool) -> pygame.Surface | None:
+        """Composite a set of tile layers into one full-map surface.
 
+        Tiles never change after load, so this runs once per map and each
+        frame is a single clipped blit instead of one blit per visible tile.
+        """
+        if not layer_indices and alpha:
+            return None
+        size = (self.width_px, self.height_px)
+        # Below-sprite layers are drawn over black, so bake that in
+        surf = make_surface(size, alpha=alpha)
+        get_tile_image = self.tmx_data.get_tile_image
+        tw, th = self.tile_width, self.tile_height
+        blits = []
         for layer_idx in layer_indices:
-            for row in range(start_row, end_row):
-                for col in range(start_col, end_col):
-                    image = self.tmx_data.get_tile_image(col, row, layer_idx)
+            for row in range(self.height_tiles):
+                for col in range(self.width_tiles):
+                    image = get_tile_image(col, row, layer_idx)
                     if image:
-                        world_rect = pygame.Rect(
-                            col * self.tile_width, row * self.tile_height,
-                            self.tile_width, self.tile_height,
-                        )
-                        screen_rect = camera.apply(world_rect)
-                        screen.blit(image, screen_rect)
+                        blits.append((image, (col * tw, row * th)))
+        surf.blits(blits, doreturn=False)
+        return surf
+
+    def _draw_layers(self, screen, camera, surf):
+        """Blit the visible part of a prerendered layer surface."""
+        screen.blit(
+            surf, (0, 0), (camera.x, camera.y, camera.screen_width, camera.screen_height)
+        )
 
     def draw_below(self, screen, camera):
         """Draw tile layers that render below sprites (ground, detail)."""
-        self._draw_layers(screen, camera, self._below_layers)
+        if self._below_surface is None:
+            # Always built, even with no layers, so the map area is opaque
+            self._below_surface = self._prerender_layers(self._below_layers, alpha=False)
+        self._draw_layers(screen, camera, self._below_surface)
 
     def draw_above(self, screen, camera):
         """Draw tile layers that render above sprites (fringe, canopy)."""
-        self._draw_layers(screen, camera, self._above_layers)
+        if self._above_surface is None:
+            self._above_surface = self._prerender_layers(self._above_layers, alpha=True)
+            if self._above_surface is None:
+                return
+        self._draw_layers(screen, camera, self._above_surface)
 
     # ------------------------------------------------------------------
     # Entity parsing — read object layers from the TMX
@@ -6,12 +6,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# map_id -> warnings from its first load; map content is static per session
+_validated: dict[str, list[str]] = {}
+
 
 def validate_map(map_id: str, map_def, tiled_renderer) -> list[str]:
     """Return list of warning/error messages for a map's content references.
 
-    Runs once per map load as a dev-time safety net.
+    Runs on the first load of each map as a dev-time safety net; later
+    loads return the cached result without re-walking the TMX objects.
     """
+    if map_id in _validated:
+        return _validated[map_id]
+
     from bit_flippers.combat import ENEMY_TYPES
     from bit_flippers.maps import MAP_REGISTRY
     from bit_flippers.strings import get_npc_dialogue
@@ -71,4 +78,5 @@ def validate_map(map_id: str, map_def, tiled_renderer) -> list[str]:
                 warnings.append(msg)
                 logger.warning(msg)
 
+    _validated[map_id] = warnings
     return warnings